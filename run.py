@@ -13,6 +13,14 @@ from sap2.applicability.params import ApplicabilityParams
 from sap2.engine.export import run_and_export
 
 
+def _positive_int(value: str) -> int:
+    """argparse type: an integer >= 1"""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be >= 1 (got {number})")
+    return number
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="SAP² - Small Audio Post-Processor")
     parser.add_argument(
@@ -49,6 +57,12 @@ def main() -> None:
         action="store_true",
         help="Accept time-series proxies as matrix inputs"
     )
+    parser.add_argument(
+        "--jobs",
+        type=_positive_int,
+        default=1,
+        help="Worker processes, one channel per process (default: 1, sequential)"
+    )
     
     args = parser.parse_args()
     
@@ -91,6 +105,7 @@ def main() -> None:
         decoder_params_by_method=decoder_params_by_method,
         report_title="SAP² Analysis Report",
         channels=channels,
+        jobs=args.jobs,
     )
 
 
@@ -6,18 +6,35 @@ Evaluates whether decoding methods can be applied.
 JUDGMENT happens HERE with EXPLICIT parameters.
 """
 
-from typing import Dict, List, Tuple
+import functools
+from typing import Callable, Collection, Dict, List, Optional, Tuple
 
-from sap2.model.inputs import InputBundle, Input
-from sap2.model.applicability import ApplicabilityReport
-from sap2.applicability.matrix import MethodRequirements, ApplicabilityMatrix
+import numpy as np
+
+from sap2.model.inputs import (
+    InputBundle,
+    Input,
+    FAMILY_E,
+    FAMILY_DELTA,
+    FAMILY_S,
+    FAMILY_V,
+    FAMILY_M,
+    FAMILY_R,
+    METRIC_SLOTS,
+)
+from sap2.model.applicability import ApplicabilityReport, ApplicabilityStatus
+from sap2.applicability.matrix import (
+    INPUT_FAMILIES, MethodRequirements, ApplicabilityMatrix, RequirementTable
+)
 from sap2.applicability.params import ApplicabilityParams
 
 
 def evaluate_applicability(
     method: MethodRequirements,
     bundle: InputBundle,
-    params: ApplicabilityParams
+    params: ApplicabilityParams,
+    *,
+    fast: bool = False
 ) -> ApplicabilityReport:
     """
     Evaluate whether a method can be applied to an InputBundle.
@@ -28,6 +45,11 @@ def evaluate_applicability(
         method: Method requirements (from matrix)
         bundle: InputBundle (rich, from grammar builders)
         params: Explicit threshold parameters
+        fast: If True, stop at the first missing required input.
+              The status is the same ('missing_inputs'), but the report
+              only lists that input and says the evaluation stopped early.
+              Intended for gating-only callers; reports meant for humans
+              should use the default full evaluation.
         
     Returns:
         ApplicabilityReport with detailed evaluation
@@ -44,14 +66,14 @@ def evaluate_applicability(
     """
     
     # Identify required inputs
-    required = [
-        family for family, level in method.requires.items()
-        if level == 'required'
-    ]
+    required = list(method.required_families)
     
     missing: Dict[str, str] = {}
     unstable: Dict[str, str] = {}
-    diagnostics: List[str] = []
+    # Most methods end up with no diagnostics: the list is only created on demand.
+    diagnostics: Optional[List[str]] = None
+    # Thresholds, looked up once per evaluation (on the first stability check)
+    thresholds: Optional[Tuple[float, ...]] = None
     
     for family in required:
         inp = bundle.inputs[family]
@@ -60,27 +82,71 @@ def evaluate_applicability(
         if not inp.available:
             reason = ', '.join(inp.notes) if inp.notes else 'unavailable'
             missing[family] = reason
+            if diagnostics is None:
+                diagnostics = []
             diagnostics.append(f"{family}: {reason}")
+            if fast:
+                # Status is already decided; remaining inputs are not examined.
+                diagnostics.append("fast evaluation: stopped at first missing input")
+                break
             continue
         
         # Judgment check: is input stable? (using EXPLICIT params)
-        is_stable, reason = _check_stability(inp, params)
+        if thresholds is None:
+            thresholds = _stability_thresholds(params)
+        is_stable, reason = _check_stability(inp, params, thresholds)
         
         if not is_stable:
             unstable[family] = reason
+            if diagnostics is None:
+                diagnostics = []
             diagnostics.append(f"{family}: {reason}")
     
     # Determine final status
     if missing:
-        status = 'missing_inputs'
+        status = ApplicabilityStatus.MISSING_INPUTS
     elif unstable:
-        status = 'underconstrained'
+        status = ApplicabilityStatus.UNDERCONSTRAINED
     else:
-        status = 'applicable'
+        status = ApplicabilityStatus.APPLICABLE
     
-    # Build provenance
-    provenance = {
-        'method_source': method.source_file,
+    return ApplicabilityReport(
+        method_id=method.method_id,
+        family=method.family,
+        label=method.label,
+        status=status,
+        required_inputs=required,
+        missing_inputs=missing,
+        unstable_inputs=unstable,
+        diagnostics=tuple(diagnostics) if diagnostics is not None else (),
+        provenance=_build_provenance(method, bundle, params)
+    )
+
+
+def _build_provenance(
+    method: MethodRequirements,
+    bundle: InputBundle,
+    params: ApplicabilityParams,
+    base: Optional[Dict] = None
+) -> Dict:
+    """
+    Provenance block of an ApplicabilityReport.
+    
+    base: _provenance_base(bundle, params), when the caller already built it
+    """
+    if base is None:
+        base = _provenance_base(bundle, params)
+    return {'method_source': method.source_file, **base}
+
+
+def _provenance_base(bundle: InputBundle, params: ApplicabilityParams) -> Dict:
+    """
+    Method-independent part of the provenance block.
+    
+    Built once per bundle evaluation; the nested 'thresholds' dict is shared
+    by every report of that evaluation and must be treated as read-only.
+    """
+    return {
         'params_version': '1.0.0',
         'bundle_channel': bundle.channel,
         'thresholds': {
@@ -92,124 +158,345 @@ def evaluate_applicability(
             'min_relation_types': params.min_relation_types
         }
     }
-    
-    return ApplicabilityReport(
-        method_id=method.method_id,
-        family=method.family,
-        label=method.label,
-        status=status,
-        required_inputs=required,
-        missing_inputs=missing,
-        unstable_inputs=unstable,
-        diagnostics=diagnostics,
-        provenance=provenance
-    )
 
 
-def _check_stability(inp: Input, params: ApplicabilityParams) -> Tuple[bool, str]:
+def _check_stability(
+    inp: Input,
+    params: ApplicabilityParams,
+    thresholds: Optional[Tuple[float, ...]] = None
+) -> Tuple[bool, str]:
     """
     Check if an input is stable according to thresholds.
     
     This applies EXPLICIT thresholds from params.
+    Scalar form of the rules evaluated by _assess_families
+    (see _STABILITY_VALUES and _stability_thresholds).
     
     Args:
         inp: Input to check
         params: Threshold parameters
+        thresholds: _stability_thresholds(params), when the caller already has it
         
     Returns:
         (is_stable, reason) tuple
         - is_stable: True if passes all thresholds
         - reason: Explanation if unstable (empty if stable)
     """
-    
+    if thresholds is None:
+        thresholds = _stability_thresholds(params)
     family = inp.family
-    metrics = inp.metrics
-    
-    # E (Events) stability
-    if family == 'E':
-        regularity = metrics.get('regularity_score', 0.0)
-        if regularity < params.min_regularity:
-            return (False, f"low regularity {regularity:.3f} < {params.min_regularity}")
-    
-    # Δ (Intervals) stability
-    elif family == 'Δ':
-        cv = metrics.get('coefficient_of_variation', 0.0)
-        if cv > params.max_cv:
-            return (False, f"high CV {cv:.3f} > {params.max_cv}")
-    
-    # S (Symbols) stability
-    elif family == 'S':
-        ratio_short = metrics.get('ratio_short', 0.0)
-        ratio_long = metrics.get('ratio_long', 0.0)
-        min_ratio = min(ratio_short, ratio_long)
-        
-        if min_ratio < params.min_symbol_balance:
-            return (False, f"unbalanced {min_ratio:.3f} < {params.min_symbol_balance}")
-    
-    # V (Vectors) stability
-    elif family == 'V':
-        num_sources = int(metrics.get('num_sources', 0))
-        if num_sources < params.min_vector_sources:
-            return (False, f"insufficient sources {num_sources} < {params.min_vector_sources}")
-    
-    # M (Matrices) stability
-    elif family == 'M':
-        is_proxy_only = metrics.get('is_proxy_only', 0.0) > 0.5
-        
-        if is_proxy_only and not params.accept_matrix_proxies:
-            return (False, "using proxies only (set accept_matrix_proxies=True to allow)")
+    j, value_of, upper_bound = _STABILITY_RULES[family]
+    value = value_of(inp.metrics_vec)
     
-    # R (Relations) stability
-    elif family == 'R':
-        num_types = int(metrics.get('num_relation_types', 0))
-        if num_types < params.min_relation_types:
-            return (False, f"insufficient types {num_types} < {params.min_relation_types}")
+    if upper_bound:
+        is_stable = not (value > thresholds[j])
+    else:
+        is_stable = not (value < thresholds[j])
     
-    # If we get here, input is stable
-    return (True, '')
+    if is_stable:
+        return (True, '')
+    return (False, _UNSTABLE_REASONS[family](value, params))
+
+
+# Column of each family in INPUT_FAMILIES
+_FAMILY_INDEX: Dict[str, int] = {family: j for j, family in enumerate(INPUT_FAMILIES)}
+
+# Stability rules, one column per family (INPUT_FAMILIES order):
+# a Python scalar read from Input.metrics_vec (ndarray.item), compared
+# against one threshold.
+# Unstable when value < threshold, or value > threshold for upper bounds.
+_REGULARITY = METRIC_SLOTS['regularity_score']
+_CV = METRIC_SLOTS['coefficient_of_variation']
+_RATIO_SHORT = METRIC_SLOTS['ratio_short']
+_RATIO_LONG = METRIC_SLOTS['ratio_long']
+_NUM_SOURCES = METRIC_SLOTS['num_sources']
+_IS_PROXY_ONLY = METRIC_SLOTS['is_proxy_only']
+_NUM_RELATION_TYPES = METRIC_SLOTS['num_relation_types']
+
+_STABILITY_VALUES: Dict[str, Callable[[np.ndarray], float]] = {
+    # E (Events): regularity
+    FAMILY_E: lambda v: v.item(_REGULARITY),
+    # Δ (Intervals): coefficient of variation
+    FAMILY_DELTA: lambda v: v.item(_CV),
+    # S (Symbols): minority symbol ratio
+    FAMILY_S: lambda v: min(v.item(_RATIO_SHORT), v.item(_RATIO_LONG)),
+    # V (Vectors): number of sources (whole count)
+    FAMILY_V: lambda v: int(v.item(_NUM_SOURCES)),
+    # M (Matrices): proxy-only flag
+    FAMILY_M: lambda v: v.item(_IS_PROXY_ONLY),
+    # R (Relations): number of relation types (whole count)
+    FAMILY_R: lambda v: int(v.item(_NUM_RELATION_TYPES)),
+}
+
+_UPPER_BOUND = np.array(
+    [family in (FAMILY_DELTA, FAMILY_M) for family in INPUT_FAMILIES],
+    dtype=bool
+)
+
+# Scalar form, one lookup per family: (column, value reader, upper bound)
+_STABILITY_RULES: Dict[str, Tuple[int, Callable[[np.ndarray], float], bool]] = {
+    family: (j, _STABILITY_VALUES[family], bool(_UPPER_BOUND[j]))
+    for j, family in enumerate(INPUT_FAMILIES)
+}
+
+
+def _stability_thresholds(params: ApplicabilityParams) -> Tuple[float, ...]:
+    """Threshold per family column (INPUT_FAMILIES order)"""
+    # ApplicabilityParams is mutable (unhashable): memoize on its current values.
+    return _threshold_values(
+        params.min_regularity,
+        params.max_cv,
+        params.min_symbol_balance,
+        params.min_vector_sources,
+        params.accept_matrix_proxies,
+        params.min_relation_types,
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _threshold_values(
+    min_regularity: float,
+    max_cv: float,
+    min_symbol_balance: float,
+    min_vector_sources: int,
+    accept_matrix_proxies: bool,
+    min_relation_types: int,
+) -> Tuple[float, ...]:
+    return (
+        min_regularity,
+        max_cv,
+        min_symbol_balance,
+        min_vector_sources,
+        # Proxy-only matrices (flag > 0.5) are unstable unless proxies are accepted
+        np.inf if accept_matrix_proxies else 0.5,
+        min_relation_types,
+    )
+
+
+# Reasons are only formatted for unstable families.
+_UNSTABLE_REASONS: Dict[str, Callable[[float, ApplicabilityParams], str]] = {
+    FAMILY_E: lambda v, p: f"low regularity {v:.3f} < {p.min_regularity}",
+    FAMILY_DELTA: lambda v, p: f"high CV {v:.3f} > {p.max_cv}",
+    FAMILY_S: lambda v, p: f"unbalanced {v:.3f} < {p.min_symbol_balance}",
+    FAMILY_V: lambda v, p: f"insufficient sources {v} < {p.min_vector_sources}",
+    FAMILY_M: lambda v, p: "using proxies only (set accept_matrix_proxies=True to allow)",
+    FAMILY_R: lambda v, p: f"insufficient types {v} < {p.min_relation_types}",
+}
 
 
 def evaluate_all_methods(
     matrix: ApplicabilityMatrix,
     bundle: InputBundle,
-    params: ApplicabilityParams
+    params: ApplicabilityParams,
+    *,
+    fast: bool = False,
+    method_ids: Optional[Collection[str]] = None
 ) -> Dict[str, ApplicabilityReport]:
     """
     Evaluate all methods in the matrix.
     
     Helper function to evaluate the entire matrix at once.
+    Produces the same reports as calling evaluate_applicability per method,
+    but each input family is assessed once per bundle, and statuses are
+    derived for all methods at once from matrix.requirement_table.
+    Statuses and per-method details are memoized on (table, family states,
+    fast): bundles with the same profile (e.g. other channels) reuse them and
+    only build their reports (whose provenance names the channel).
     
     Args:
         matrix: Complete applicability matrix
         bundle: InputBundle (rich)
         params: Threshold parameters
+        fast: Stop each evaluation at its first missing input
+              (see evaluate_applicability)
+        method_ids: If given, only these methods are evaluated; the others
+                    are absent from the result (not reported as anything).
         
     Returns:
         Dict mapping method_id → ApplicabilityReport
     """
     
+    table = matrix.requirement_table
+    available, _, reasons = _assess_families(bundle, params)
+    
+    # Everything the statuses and details depend on, in hashable form
+    family_states = tuple(
+        (bool(available[j]), reasons.get(family))
+        for j, family in enumerate(INPUT_FAMILIES)
+    )
+    outcomes = _table_outcomes(table, family_states, fast)
+    
+    provenance_base = _provenance_base(bundle, params)
+    
     reports = {}
     
-    for method_id, method in matrix.methods.items():
-        reports[method_id] = evaluate_applicability(method, bundle, params)
+    for i, method_id in enumerate(table.method_ids):
+        if method_ids is not None and method_id not in method_ids:
+            continue
+        method = matrix.methods[method_id]
+        status, missing, unstable, diagnostics = outcomes[i]
+        
+        # Reports own their dicts (copied from the memoized tuples);
+        # the diagnostics tuple is immutable and shared as is.
+        reports[method_id] = ApplicabilityReport(
+            method_id=method.method_id,
+            family=method.family,
+            label=method.label,
+            status=status,
+            required_inputs=list(table.required_families[i]),
+            missing_inputs=dict(missing),
+            unstable_inputs=dict(unstable),
+            diagnostics=diagnostics,
+            provenance=_build_provenance(method, bundle, params, provenance_base)
+        )
     
     return reports
 
 
+_FamilyStates = Tuple[Tuple[bool, Optional[str]], ...]
+
+
+@functools.lru_cache(maxsize=64)
+def _table_outcomes(
+    table: RequirementTable,
+    family_states: _FamilyStates,
+    fast: bool
+) -> Tuple[Tuple[ApplicabilityStatus, Tuple, Tuple, Tuple[str, ...]], ...]:
+    """
+    (status, missing, unstable, diagnostics) of every method of a table.
+    
+    Pure function of its arguments (the table is hashed by identity), hence
+    memoized. A family is stable iff it is available and has no reason.
+    """
+    available = np.array([is_available for is_available, _ in family_states], dtype=bool)
+    stable = np.array(
+        [is_available and reason is None for is_available, reason in family_states],
+        dtype=bool
+    )
+    status_codes = _status_codes(table.required_mask, available, stable)
+    
+    return tuple(
+        (_STATUS_BY_CODE[code],)
+        + _method_details(required_families, family_states, fast)
+        for code, required_families in zip(status_codes.tolist(), table.required_families)
+    )
+
+
+def _method_details(
+    required_families: Tuple[str, ...],
+    family_states: _FamilyStates,
+    fast: bool
+) -> Tuple[Tuple[Tuple[str, str], ...], Tuple[Tuple[str, str], ...], Tuple[str, ...]]:
+    """
+    Missing inputs, unstable inputs and diagnostics of one method.
+    
+    family_states: (available, reason) per INPUT_FAMILIES column.
+    """
+    missing: List[Tuple[str, str]] = []
+    unstable: List[Tuple[str, str]] = []
+    diagnostics: List[str] = []
+    
+    for family in required_families:
+        is_available, reason = family_states[_FAMILY_INDEX[family]]
+        if reason is None:
+            continue
+        diagnostics.append(f"{family}: {reason}")
+        if is_available:
+            unstable.append((family, reason))
+            continue
+        missing.append((family, reason))
+        if fast:
+            diagnostics.append("fast evaluation: stopped at first missing input")
+            break
+    
+    return tuple(missing), tuple(unstable), tuple(diagnostics)
+
+
+_STATUS_BY_CODE = (
+    ApplicabilityStatus.APPLICABLE,
+    ApplicabilityStatus.UNDERCONSTRAINED,
+    ApplicabilityStatus.MISSING_INPUTS,
+)
+
+
+def _status_codes(
+    required_mask: np.ndarray,
+    available: np.ndarray,
+    stable: np.ndarray
+) -> np.ndarray:
+    """
+    Status code (index into _STATUS_BY_CODE) of every method, in one array pass.
+    
+    missing_inputs takes precedence over underconstrained, as in
+    evaluate_applicability.
+    """
+    missing_any = (required_mask & ~available).any(axis=1)
+    unstable_any = (required_mask & available & ~stable).any(axis=1)
+    return np.where(missing_any, 2, np.where(unstable_any, 1, 0))
+
+
+def _assess_families(
+    bundle: InputBundle,
+    params: ApplicabilityParams
+) -> Tuple[np.ndarray, np.ndarray, Dict[str, str]]:
+    """
+    Assess availability and stability of each family of a bundle once.
+    
+    Returns:
+        (available, stable, reasons) tuple
+        - available: bool vector, columns follow INPUT_FAMILIES
+        - stable: bool vector (False for unavailable families)
+        - reasons: family → missing or unstable reason (absent if fine)
+    """
+    available = np.zeros(len(INPUT_FAMILIES), dtype=bool)
+    values = np.zeros(len(INPUT_FAMILIES), dtype=np.float64)
+    raw: Dict[str, float] = {}
+    reasons: Dict[str, str] = {}
+    
+    for j, family in enumerate(INPUT_FAMILIES):
+        inp = bundle.inputs[family]
+        if not inp.available:
+            reasons[family] = ', '.join(inp.notes) if inp.notes else 'unavailable'
+            continue
+        available[j] = True
+        raw[family] = _STABILITY_VALUES[family](inp.metrics_vec)
+        values[j] = raw[family]
+    
+    # All six threshold comparisons at once; NaN compares False (stable),
+    # as in the scalar form.
+    thresholds = np.array(_stability_thresholds(params), dtype=np.float64)
+    exceeded = np.where(_UPPER_BOUND, values > thresholds, values < thresholds)
+    stable = available & ~exceeded
+    
+    for j in np.flatnonzero(available & exceeded):
+        family = INPUT_FAMILIES[j]
+        reasons[family] = _UNSTABLE_REASONS[family](raw[family], params)
+    
+    return available, stable, reasons
+
+
 def filter_applicable(
-    reports: Dict[str, ApplicabilityReport]
+    reports: Dict[str, ApplicabilityReport],
+    out: Optional[Dict[str, ApplicabilityReport]] = None
 ) -> Dict[str, ApplicabilityReport]:
     """
     Filter to only applicable methods.
     
     Args:
         reports: All reports
+        out: Optional dict to fill in place (returned); a new dict otherwise
         
     Returns:
         Only reports with status='applicable'
     """
-    return {
-        mid: report 
-        for mid, report in reports.items() 
-        if report.status == 'applicable'
-    }
\ No newline at end of file
+    if out is None:
+        return {
+            mid: report
+            for mid, report in reports.items()
+            if report.status == ApplicabilityStatus.APPLICABLE
+        }
+    
+    for mid, report in reports.items():
+        if report.status == ApplicabilityStatus.APPLICABLE:
+            out[mid] = report
+    return out
\ No newline at end of file
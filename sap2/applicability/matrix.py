@@ -7,12 +7,17 @@ DUMB MODULE: no logic, no judgment, just data structures.
 """
 
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import Mapping
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import List, Mapping, Tuple
+
+import numpy as np
+
+from sap2.model.inputs import FAMILIES
 
 
 # Canonical input family names
-INPUT_FAMILIES = ['E', 'Δ', 'S', 'V', 'M', 'R']
+INPUT_FAMILIES = list(FAMILIES)
 
 # Valid requirement levels
 REQUIREMENT_LEVELS = ['required', 'optional', 'not_applicable']
@@ -34,6 +39,8 @@ class MethodRequirements:
                   Keys: E, Δ, S, V, M, R
                   Values: required | optional | not_applicable
         source_file: Which YAML file defined this method
+        required_families: Families at level 'required', in declaration order
+                           (derived, not passed)
     """
     
     method_id: str
@@ -41,6 +48,7 @@ class MethodRequirements:
     label: str
     requires: Mapping[str, str]
     source_file: str
+    required_families: Tuple[str, ...] = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate structure (minimal checks)"""
@@ -58,6 +66,50 @@ class MethodRequirements:
                     f"Method {self.method_id}: invalid level '{level}' for {family}. "
                     f"Must be one of: {REQUIREMENT_LEVELS}"
                 )
+        
+        # Derived once; evaluation reads this instead of walking `requires`
+        object.__setattr__(self, 'required_families', tuple(
+            family for family, level in self.requires.items()
+            if level == 'required'
+        ))
+
+
+@dataclass(frozen=True, eq=False)
+class RequirementTable:
+    """
+    Column layout of the 'required' levels of every method.
+    
+    Derived from ApplicabilityMatrix.methods for batch evaluation.
+    No logic, no evaluation. Compared and hashed by identity, so that
+    evaluation results can be memoized per table.
+    
+    Attributes:
+        method_ids: Method identifiers, in matrix order (one row each)
+        required_mask: bool array (n_methods, 6); columns follow INPUT_FAMILIES
+        required_families: Per method, required families in declaration order
+    """
+    
+    method_ids: Tuple[str, ...]
+    required_mask: np.ndarray
+    required_families: Tuple[Tuple[str, ...], ...]
+    
+    @classmethod
+    def from_methods(cls, methods: Mapping[str, MethodRequirements]) -> RequirementTable:
+        """Build the table from loaded method requirements"""
+        method_ids = tuple(methods.keys())
+        required_families = tuple(methods[mid].required_families for mid in method_ids)
+        
+        required_mask = np.array(
+            [[family in families for family in INPUT_FAMILIES] for families in required_families],
+            dtype=bool
+        ).reshape(len(method_ids), len(INPUT_FAMILIES))
+        required_mask.setflags(write=False)
+        
+        return cls(
+            method_ids=method_ids,
+            required_mask=required_mask,
+            required_families=required_families
+        )
 
 
 @dataclass(frozen=True)
@@ -82,6 +134,26 @@ class ApplicabilityMatrix:
             raise KeyError(f"Method not found: {method_id}")
         return self.methods[method_id]
     
+    @cached_property
+    def requirement_table(self) -> RequirementTable:
+        """Requirement table of all methods (built once per matrix)"""
+        return RequirementTable.from_methods(self.methods)
+    
+    def get_used_input_families(self) -> List[str]:
+        """
+        Get input families used by at least one method (required or optional).
+        
+        Returned in canonical INPUT_FAMILIES order.
+        """
+        return [
+            family
+            for family in INPUT_FAMILIES
+            if any(
+                method.requires[family] != 'not_applicable'
+                for method in self.methods.values()
+            )
+        ]
+    
     def get_methods_by_family(self, family: str) -> Mapping[str, MethodRequirements]:
         """Get all methods in a family"""
         return {
@@ -15,12 +15,15 @@ Types are defined in:
 
 from __future__ import annotations
 
+import functools
+import itertools
 from pathlib import Path
-from typing import Any, Dict, List, Mapping
+from typing import Any, Dict, List, Mapping, Tuple
 
 import json
 import yaml
 from jsonschema import Draft202012Validator
+from jsonschema.exceptions import SchemaError
 
 from sap2.applicability.matrix import (
     ApplicabilityMatrix,
@@ -28,6 +31,25 @@ from sap2.applicability.matrix import (
     INPUT_FAMILIES,
 )
 
+# Prefer libyaml's C loader when PyYAML was built with it; the pure-Python
+# SafeLoader accepts the same documents, only slower. Resolved once at import.
+try:
+    from yaml import CSafeLoader as _YamlSafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlSafeLoader
+
+# orjson is an optional accelerator for the schema and JSON mirrors. Both
+# parsers accept UTF-8 bytes and produce the same plain dicts/lists.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # optional dependency not installed
+    _json_loads = json.loads
+
+
+# Schema errors listed per file before truncating the report
+_MAX_REPORTED_ERRORS = 20
+
 
 class MatrixLoadError(RuntimeError):
     """Raised when the applicability matrix cannot be loaded or validated."""
@@ -39,12 +61,44 @@ def load_applicability_matrix(matrices_dir: Path | str) -> ApplicabilityMatrix:
       - _index.yaml
       - matrix.schema.json
       - <family>.yaml files (time_domain.yaml, frequency_domain.yaml, ...)
+
+    Each YAML file may have a JSON mirror next to it (_index.json, time_domain.json, ...),
+    generated by sap2.applicability.matrix_mirror. A mirror is read instead of its YAML
+    source only when it is at least as recent as that source; YAML stays authoritative.
+
+    Loaded matrices are memoized per directory. The cache key includes the (name, mtime, size)
+    of every file in matrices_dir, so any edit, addition or removal triggers a full reload;
+    an unchanged directory costs one stat() per file. The returned matrix may therefore be
+    shared between callers and must be treated as read-only.
     """
     matrices_dir = Path(matrices_dir)
 
     if not matrices_dir.exists() or not matrices_dir.is_dir():
         raise MatrixLoadError(f"matrices_dir does not exist or is not a directory: {matrices_dir}")
 
+    return _load_cached(matrices_dir, _directory_signature(matrices_dir))
+
+
+def _directory_signature(matrices_dir: Path) -> Tuple[Tuple[str, int, int], ...]:
+    """Stat-only fingerprint of matrices_dir: (name, mtime_ns, size) for every file."""
+    entries: List[Tuple[str, int, int]] = []
+    for path in sorted(matrices_dir.iterdir()):
+        if path.is_file():
+            st = path.stat()
+            entries.append((path.name, st.st_mtime_ns, st.st_size))
+    return tuple(entries)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_cached(
+    matrices_dir: Path,
+    signature: Tuple[Tuple[str, int, int], ...],
+) -> ApplicabilityMatrix:
+    # `signature` is only part of the cache key; failed loads raise and are not cached.
+    return _load_uncached(matrices_dir)
+
+
+def _load_uncached(matrices_dir: Path) -> ApplicabilityMatrix:
     index_path = matrices_dir / "_index.yaml"
     schema_path = matrices_dir / "matrix.schema.json"
 
@@ -56,6 +110,9 @@ def load_applicability_matrix(matrices_dir: Path | str) -> ApplicabilityMatrix:
     index_doc = _read_yaml(index_path)
     schema_doc = _read_json(schema_path)
 
+    # Compile the schema once; every matrix file below is checked by the same validator.
+    validator = _build_validator(schema_doc, schema_path)
+
     _validate_index(index_doc, index_path)
 
     # Contract check: ensure index and code agree on the canonical family list
@@ -73,26 +130,13 @@ def load_applicability_matrix(matrices_dir: Path | str) -> ApplicabilityMatrix:
     methods: Dict[str, MethodRequirements] = {}
 
     for entry in matrices_entries:
-        file_name = entry["file"]
         family_expected = entry["family"]
 
-        doc_path = matrices_dir / file_name
+        doc_path = matrices_dir / entry["file"]
         if not doc_path.exists():
             raise MatrixLoadError(f"Matrix file referenced in _index.yaml not found: {doc_path}")
 
-        doc = _read_yaml(doc_path)
-        _validate_against_schema(schema_doc, doc, doc_path)
-
-        family_in_doc = doc.get("family")
-        if family_in_doc != family_expected:
-            raise MatrixLoadError(
-                f"Family mismatch for {doc_path}: index says '{family_expected}' "
-                f"but file says '{family_in_doc}'"
-            )
-
-        doc_methods = doc.get("methods")
-        if not isinstance(doc_methods, dict) or not doc_methods:
-            raise MatrixLoadError(f"{doc_path}: 'methods' must be a non-empty object")
+        doc_methods = _load_document(doc_path, family_expected, validator)
 
         for method_id, spec in doc_methods.items():
             if method_id in methods:
@@ -116,10 +160,43 @@ def load_applicability_matrix(matrices_dir: Path | str) -> ApplicabilityMatrix:
     return ApplicabilityMatrix(schema_version=schema_version, methods=methods)
 
 
-def _read_yaml(path: Path) -> Dict[str, Any]:
+def _load_document(
+    doc_path: Path,
+    family_expected: str,
+    validator: Draft202012Validator,
+) -> Dict[str, Any]:
+    """Read and validate one matrix file; return its 'methods' mapping."""
+    doc = _read_yaml(doc_path)
+    _validate_against_schema(validator, doc, doc_path)
+
+    family_in_doc = doc.get("family")
+    if family_in_doc != family_expected:
+        raise MatrixLoadError(
+            f"Family mismatch for {doc_path}: index says '{family_expected}' "
+            f"but file says '{family_in_doc}'"
+        )
+
+    doc_methods = doc.get("methods")
+    if not isinstance(doc_methods, dict) or not doc_methods:
+        raise MatrixLoadError(f"{doc_path}: 'methods' must be a non-empty object")
+
+    return doc_methods
+
+
+def _read_yaml(path: Path, *, prefer_json_mirror: bool = True) -> Dict[str, Any]:
+    # JSON parses far faster than YAML. A stale mirror (older than its YAML source)
+    # is ignored so that edits to the YAML always take effect.
+    if prefer_json_mirror:
+        mirror_path = path.with_suffix(".json")
+        if mirror_path.is_file() and mirror_path.stat().st_mtime_ns >= path.stat().st_mtime_ns:
+            data = _read_json(mirror_path)
+            if not isinstance(data, dict):
+                raise MatrixLoadError(f"JSON root must be a mapping/object: {mirror_path}")
+            return data
+
     try:
         with path.open("r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_YamlSafeLoader)
     except Exception as e:
         raise MatrixLoadError(f"Failed to read YAML: {path} ({e})") from e
 
@@ -131,23 +208,41 @@ def _read_yaml(path: Path) -> Dict[str, Any]:
 
 def _read_json(path: Path) -> Dict[str, Any]:
     try:
-        with path.open("r", encoding="utf-8") as f:
-            return json.load(f)
+        return _json_loads(path.read_bytes())
     except Exception as e:
         raise MatrixLoadError(f"Failed to read JSON: {path} ({e})") from e
 
 
-def _validate_against_schema(schema: Dict[str, Any], doc: Dict[str, Any], doc_path: Path) -> None:
-    validator = Draft202012Validator(schema)
-    errors = sorted(validator.iter_errors(doc), key=lambda e: e.path)
+def _build_validator(schema: Dict[str, Any], schema_path: Path) -> Draft202012Validator:
+    try:
+        Draft202012Validator.check_schema(schema)
+    except SchemaError as e:
+        raise MatrixLoadError(f"Invalid matrix schema: {schema_path} ({e.message})") from e
+
+    return Draft202012Validator(schema)
+
+
+def _validate_against_schema(
+    validator: Draft202012Validator,
+    doc: Dict[str, Any],
+    doc_path: Path,
+) -> None:
+    # Happy path: is_valid() stops at the first error, so valid files never pay
+    # for collecting every error.
+    if validator.is_valid(doc):
+        return
+
+    # Only the first _MAX_REPORTED_ERRORS are reported; one extra error is pulled
+    # to know whether more exist, without walking the rest of the document.
+    errors = list(itertools.islice(validator.iter_errors(doc), _MAX_REPORTED_ERRORS + 1))
 
     if errors:
         lines: List[str] = [f"Schema validation failed for: {doc_path}"]
-        for err in errors[:20]:
+        for err in errors[:_MAX_REPORTED_ERRORS]:
             loc = ".".join([str(p) for p in err.absolute_path]) or "<root>"
             lines.append(f"- {loc}: {err.message}")
-        if len(errors) > 20:
-            lines.append(f"... and {len(errors) - 20} more error(s)")
+        if len(errors) > _MAX_REPORTED_ERRORS:
+            lines.append("... and more error(s)")
         raise MatrixLoadError("\n".join(lines))
 
 
@@ -0,0 +1,66 @@
+"""
+sap2/applicability/matrix_mirror.py
+
+Offline build step: writes a JSON mirror next to each applicability matrix YAML file.
+
+YAML remains the authoring source. The loader (sap2.applicability.matrix_loader) reads a
+mirror instead of its YAML source only when the mirror is at least as recent, so a mirror
+that was not regenerated after a YAML edit is simply ignored.
+
+Usage:
+    python -m sap2.applicability.matrix_mirror [matrices_dir]
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+from typing import List
+
+from sap2.applicability.matrix_loader import MatrixLoadError, _read_yaml
+
+
+DEFAULT_MATRICES_DIR = Path(__file__).parent / "matrices"
+
+
+def write_json_mirrors(matrices_dir: Path | str = DEFAULT_MATRICES_DIR) -> List[Path]:
+    """
+    Re-serialize every *.yaml file of matrices_dir (including _index.yaml) to a sibling .json.
+
+    No validation happens here: the loader validates the documents it reads,
+    whether they come from YAML or from a mirror.
+
+    Returns:
+        Paths of the written JSON mirrors
+    """
+    matrices_dir = Path(matrices_dir)
+
+    if not matrices_dir.is_dir():
+        raise MatrixLoadError(f"matrices_dir does not exist or is not a directory: {matrices_dir}")
+
+    written: List[Path] = []
+
+    for yaml_path in sorted(matrices_dir.glob("*.yaml")):
+        # Always read the YAML source itself, never a previous mirror
+        doc = _read_yaml(yaml_path, prefer_json_mirror=False)
+
+        mirror_path = yaml_path.with_suffix(".json")
+        with mirror_path.open("w", encoding="utf-8") as f:
+            json.dump(doc, f, ensure_ascii=False, indent=2)
+            f.write("\n")
+
+        written.append(mirror_path)
+
+    return written
+
+
+def main() -> None:
+    matrices_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_MATRICES_DIR
+
+    for mirror_path in write_json_mirrors(matrices_dir):
+        print(f"wrote {mirror_path}")
+
+
+if __name__ == "__main__":
+    main()
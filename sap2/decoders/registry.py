@@ -8,7 +8,7 @@ This module must remain simple:
 - No parameter logic
 - No fallback heuristics
 
-It only maps method_id -> Decoder instance.
+It only maps method_id -> Decoder class, and instantiates a decoder on first use.
 
 Important:
 - Only register decoders that are actually implemented.
@@ -18,7 +18,7 @@ Important:
 
 from __future__ import annotations
 
-from typing import Dict, Optional
+from typing import Callable, Dict, FrozenSet, Optional
 
 from sap2.decoders.base import Decoder
 
@@ -34,13 +34,17 @@ from sap2.decoders.time_domain.amplitude_modulation_am import AmplitudeModulatio
 
 
 # Registry is a pure mapping. Keys must match method_id in the applicability matrix YAML.
-_DECODERS: Dict[str, Decoder] = {
-    DurationBasedMorseLikeDecoder.method_id: DurationBasedMorseLikeDecoder(),
-    # SpectralStabilityEncodingDecoder.method_id: SpectralStabilityEncodingDecoder(),
-    # PhaseDeltaDecoder.method_id: PhaseDeltaDecoder(),
-    AmplitudeModulationAmDecoder.method_id: AmplitudeModulationAmDecoder(),
+# Values are decoder classes; instances are created on first get_decoder() call.
+_DECODER_FACTORIES: Dict[str, Callable[[], Decoder]] = {
+    DurationBasedMorseLikeDecoder.method_id: DurationBasedMorseLikeDecoder,
+    # SpectralStabilityEncodingDecoder.method_id: SpectralStabilityEncodingDecoder,
+    # PhaseDeltaDecoder.method_id: PhaseDeltaDecoder,
+    AmplitudeModulationAmDecoder.method_id: AmplitudeModulationAmDecoder,
 }
 
+# method_id -> decoder instance, filled by get_decoder()
+_INSTANCES: Dict[str, Decoder] = {}
+
 
 def get_decoder(method_id: str) -> Optional[Decoder]:
     """
@@ -48,13 +52,26 @@ def get_decoder(method_id: str) -> Optional[Decoder]:
 
     Not implemented is not an error: the applicability matrix may contain methods
     that are described but not yet implemented in code.
+    The instance is created on first request and reused afterwards.
     """
-    return _DECODERS.get(method_id)
+    dec = _INSTANCES.get(method_id)
+    if dec is None:
+        factory = _DECODER_FACTORIES.get(method_id)
+        if factory is None:
+            return None
+        dec = _INSTANCES.setdefault(method_id, factory())
+    return dec
+
+
+def implemented_method_ids() -> FrozenSet[str]:
+    """method_ids that have a registered decoder (no instantiation)."""
+    return frozenset(_DECODER_FACTORIES)
 
 
 def list_decoders() -> Dict[str, str]:
     """
     List implemented decoders: method_id -> decoder_version.
-    Useful for diagnostics and reporting.
+    Useful for diagnostics and reporting. Reads the class-level version,
+    without instantiating decoders.
     """
-    return {method_id: dec.version for method_id, dec in _DECODERS.items()}
+    return {method_id: cls.version for method_id, cls in _DECODER_FACTORIES.items()}
@@ -14,69 +14,109 @@ Inputs used (typical):
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import heapq
+from dataclasses import asdict, dataclass
 from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
+
 from sap2.decoders.base import DecoderParams, refused, failure
 from sap2.model.experiment import ExperimentResult, ExperimentStatus
 from sap2.model.inputs import InputBundle, Input
 
 
-def _is_printable_ascii(byte_val: int) -> bool:
-    # Printable ASCII plus common whitespace: tab, newline, carriage return, space.
-    return byte_val in (9, 10, 13) or 32 <= byte_val <= 126
+# Printable ASCII plus common whitespace: tab, newline, carriage return, space.
+_PRINTABLE_MASK = np.zeros(256, dtype=bool)
+_PRINTABLE_MASK[[9, 10, 13]] = True
+_PRINTABLE_MASK[32:127] = True
+
+
+def _is_printable_ascii(values: np.ndarray) -> np.ndarray:
+    # One table gather; frames wider than 8 bits are printable only below 256.
+    if values.dtype == np.uint8:
+        return _PRINTABLE_MASK[values]
+    return (values < 256) & _PRINTABLE_MASK[values & 0xFF]
 
 
-def _bits_to_int(bits: List[int], msb_first: bool) -> int:
-    if msb_first:
-        value = 0
-        for b in bits:
-            value = (value << 1) | (b & 1)
-        return value
+# Maps every non-printable latin-1 code point to the replacement character.
+_NON_PRINTABLE_TO_REPLACEMENT = {v: "\ufffd" for v in np.flatnonzero(~_PRINTABLE_MASK).tolist()}
 
-    value = 0
-    for i, b in enumerate(bits):
-        value |= ((b & 1) << i)
-    return value
 
+# Bit-reversal of every byte value.
+_BITREV8 = np.array([int(f"{i:08b}"[::-1], 2) for i in range(256)], dtype=np.uint8)
 
-def _decode_ascii_candidates(
-    bits: List[int],
+# Value of a wide frame with a bit set above bit 7 (not a byte, hence non-printable).
+_WIDE_OVERFLOW = np.uint16(256)
+
+
+def _frame_values(
+    bits: np.ndarray,
     frame_bits: int,
-    msb_first: bool,
     offset: int,
-) -> Tuple[str, float]:
+) -> Optional[Tuple[np.ndarray, np.ndarray]]:
     """
-    Decode bits into an ASCII string candidate.
+    Frame bits and compute the integer value of every frame in both bit orders.
+
+    bits: uint8 array of 0/1 values
 
     Returns:
-        (text, printable_ratio)
+        (msb_first_values, lsb_first_values), or None when no frame fits.
+        For frames wider than 8 bits, a value above 255 is reported as
+        _WIDE_OVERFLOW (never printable) instead of its exact value.
     """
     if frame_bits <= 0:
-        return ("", 0.0)
+        return None
 
     if offset < 0 or offset >= frame_bits:
-        return ("", 0.0)
+        return None
 
-    usable = bits[offset:]
-    n_frames = len(usable) // frame_bits
+    n_frames = (len(bits) - offset) // frame_bits
     if n_frames <= 0:
-        return ("", 0.0)
-
-    chars: List[str] = []
-    printable = 0
-
-    for i in range(n_frames):
-        frame = usable[i * frame_bits : (i + 1) * frame_bits]
-        val = _bits_to_int(frame, msb_first=msb_first)
-        if _is_printable_ascii(val):
-            printable += 1
-            chars.append(chr(val))
-        else:
-            chars.append("�")
+        return None
+
+    framed_bits = bits[offset : offset + n_frames * frame_bits]
+
+    if frame_bits == 8:
+        # Byte frames: packbits on the flat slice packs MSB-first directly,
+        # with no reshape or padding copy.
+        msb_values = np.packbits(framed_bits)
+        return (msb_values, _BITREV8[msb_values])
+
+    frames = framed_bits.reshape(n_frames, frame_bits)
+
+    if frame_bits < 8:
+        # Left-pad to a full byte and pack MSB-first; the LSB-first value is
+        # the reversed byte shifted back down to frame_bits.
+        frames = np.pad(frames, ((0, 0), (8 - frame_bits, 0)))
+        msb_values = np.packbits(frames, axis=1)[:, 0]
+        lsb_values = _BITREV8[msb_values] >> (8 - frame_bits)
+        return (msb_values, lsb_values)
+
+    # Wide frames: only frames with no bit set above bit 7 can be printable,
+    # so the low byte plus that flag is all that is kept (no integer
+    # arithmetic on the full width, which would overflow past 63 bits).
+    # Frames with a higher bit set get _WIDE_OVERFLOW.
+    msb_values = np.where(
+        frames[:, :-8].any(axis=1), _WIDE_OVERFLOW, np.packbits(frames[:, -8:], axis=1)[:, 0]
+    )
+    lsb_values = np.where(
+        frames[:, 8:].any(axis=1), _WIDE_OVERFLOW, _BITREV8[np.packbits(frames[:, :8], axis=1)[:, 0]]
+    )
+    return (msb_values, lsb_values)
+
+
+def _ascii_text(values: Optional[np.ndarray]) -> str:
+    """
+    ASCII string candidate of frame values; non-printable frames become U+FFFD.
+    """
+    if values is None:
+        return ""
 
-    ratio = printable / n_frames if n_frames > 0 else 0.0
-    return ("".join(chars), ratio)
+    return (
+        bytes(np.where(_is_printable_ascii(values), values, 0).astype(np.uint8))
+        .decode("latin-1")
+        .translate(_NON_PRINTABLE_TO_REPLACEMENT)
+    )
 
 
 @dataclass(frozen=True)
@@ -98,11 +138,12 @@ class AmplitudeModulationAmDecoder:
             )
 
         intervals = delta.data["intervals"]
-        if not isinstance(intervals, list) or len(intervals) < 8:
+        is_sequence = isinstance(intervals, (list, np.ndarray))
+        if not is_sequence or len(intervals) < 8:
             return refused(
                 self.method_id,
                 self.version,
-                f"Δ intervals too short for framing hypotheses: got {len(intervals) if isinstance(intervals, list) else 'invalid'}.",
+                f"Δ intervals too short for framing hypotheses: got {len(intervals) if is_sequence else 'invalid'}.",
             )
 
         # Optional diagnostics from V
@@ -119,42 +160,50 @@ class AmplitudeModulationAmDecoder:
             diagnostics.append("V.am_detection not present (SAT did not run am_detection or data not exported).")
 
         # Build bitstream hypotheses
-        bitstreams: List[Dict[str, Any]] = []
+        # Metadata (exported) and uint8 0/1 bits (framing only), kept in parallel.
+        bitstream_meta: List[Dict[str, Any]] = []
+        bitstream_bits: List[np.ndarray] = []
 
-        def _add_bitstream(bits: List[int], origin: str, mapping: str) -> None:
-            bitstreams.append(
+        def _add_bitstream(bits: np.ndarray, origin: str, mapping: str) -> None:
+            bitstream_meta.append(
                 {
                     "origin": origin,
                     "mapping": mapping,
                     "length_bits": len(bits),
-                    "bits": bits,
                 }
             )
+            bitstream_bits.append(bits)
 
         if sym.available and sym.data and isinstance(sym.data, dict) and "symbols" in sym.data:
             symbols = sym.data.get("symbols", [])
             if isinstance(symbols, list) and symbols:
-                bits_a = [0 if s == "short" else 1 for s in symbols]
+                is_short = np.fromiter((s == "short" for s in symbols), dtype=bool, count=len(symbols))
+
+                bits_a = (~is_short).astype(np.uint8)
                 _add_bitstream(bits_a, origin="S.symbols", mapping="short=0,long=1")
 
-                bits_b = [1 if s == "short" else 0 for s in symbols]
+                bits_b = is_short.astype(np.uint8)
                 _add_bitstream(bits_b, origin="S.symbols", mapping="short=1,long=0")
             else:
                 diagnostics.append("S available but symbols list is empty or invalid.")
         else:
             # Fallback: discretize Δ by median (explicit)
+            # Upper median (element n // 2 of the sorted values), selected
+            # without a full sort.
             try:
-                sorted_vals = sorted(float(x) for x in intervals)
-                median = sorted_vals[len(sorted_vals) // 2]
+                values = np.asarray(intervals, dtype=np.float64)
+                k = values.size // 2
+                median = float(np.partition(values, k)[k])
             except Exception as exc:
                 return failure(self.method_id, self.version, f"Failed to discretize Δ intervals: {exc}")
 
             diagnostics.append(f"Discretization fallback: median_threshold={median:.6f} (from Δ intervals).")
 
-            bits_a = [0 if float(x) < median else 1 for x in intervals]
+            # Negated '<' rather than '>=': NaN intervals map to 1, as before.
+            bits_a = (~(values < median)).astype(np.uint8)
             _add_bitstream(bits_a, origin="Δ.intervals", mapping=f"<median=0,>=median=1 (median={median:.6f})")
 
-            bits_b = [1 if float(x) < median else 0 for x in intervals]
+            bits_b = 1 - bits_a
             _add_bitstream(bits_b, origin="Δ.intervals", mapping=f"<median=1,>=median=0 (median={median:.6f})")
 
         # Generate ASCII hypotheses (structural, not interpretative)
@@ -163,37 +212,74 @@ class AmplitudeModulationAmDecoder:
         msb_first_list = params.get("msb_first_list", [True, False])
         max_hypotheses = int(params.get("max_hypotheses", 10))
 
-        candidates: List[Dict[str, Any]] = []
-
-        for bs in bitstreams:
-            bits = bs["bits"]
+        # Number of hypotheses kept: as many as slicing the full descending
+        # ranking with [:max_hypotheses] would keep (a negative value drops
+        # that many from the end).
+        n_framings = len(bitstream_bits) * len(msb_first_list) * sum(
+            len(range(min(max_offsets, max(int(frame_bits), 1)))) for frame_bits in frame_bits_list
+        )
+        n_keep = len(range(n_framings)[:max_hypotheses])
+
+        # Bounded min-heap of the best n_keep framings, kept while
+        # sweeping. Entries are ((printable_ratio, n_frames), -seq, framing)
+        # with framing = (bitstream index, frame_bits, msb_first, offset);
+        # -seq makes earlier framings win ties, as a stable descending sort
+        # would. Frame values, text and dicts are only rebuilt for the
+        # retained hypotheses (the text length is the frame count).
+        heap: List[Tuple[Tuple[float, int], int, Tuple[int, int, bool, int]]] = []
+        seq = 0
+
+        for i, bits in enumerate(bitstream_bits):
             for frame_bits in frame_bits_list:
+                offsets = range(min(max_offsets, max(int(frame_bits), 1)))
+                # Both bit orders come from one framing pass per offset.
+                framed = {offset: _frame_values(bits, int(frame_bits), offset) for offset in offsets}
                 for msb_first in msb_first_list:
-                    for offset in range(min(max_offsets, max(int(frame_bits), 1))):
-                        text, printable_ratio = _decode_ascii_candidates(
-                            bits=bits,
-                            frame_bits=int(frame_bits),
-                            msb_first=bool(msb_first),
-                            offset=int(offset),
-                        )
-                        candidates.append(
-                            {
-                                "source_bitstream": {
-                                    "origin": bs["origin"],
-                                    "mapping": bs["mapping"],
-                                },
-                                "framing": {
-                                    "frame_bits": int(frame_bits),
-                                    "msb_first": bool(msb_first),
-                                    "offset": int(offset),
-                                },
-                                "printable_ratio": float(printable_ratio),
-                                "text_candidate": text,
-                            }
-                        )
-
-        candidates.sort(key=lambda c: (c["printable_ratio"], len(c["text_candidate"])), reverse=True)
-        candidates = candidates[:max_hypotheses]
+                    for offset in offsets:
+                        seq += 1
+                        values = framed[offset]
+                        n_frames = len(values[0]) if values is not None else 0
+                        full = len(heap) >= n_keep
+
+                        # Skip framings that cannot beat the current K-th best
+                        # even if every frame were printable (all of them when
+                        # n_keep == 0).
+                        if full and (not heap or (1.0 if n_frames else 0.0, n_frames) <= heap[0][0]):
+                            continue
+
+                        if n_frames:
+                            printable = np.count_nonzero(_is_printable_ascii(values[0 if msb_first else 1]))
+                            key = (int(printable) / n_frames, n_frames)
+                        else:
+                            key = (0.0, 0)
+
+                        entry = (key, -seq, (i, int(frame_bits), bool(msb_first), offset))
+                        if not full:
+                            heapq.heappush(heap, entry)
+                        elif key > heap[0][0]:
+                            heapq.heapreplace(heap, entry)
+
+        best = sorted(heap, reverse=True)
+
+        candidates: List[Dict[str, Any]] = []
+        for (printable_ratio, _), _, (i, frame_bits, msb_first, offset) in best:
+            framed = _frame_values(bitstream_bits[i], frame_bits, offset)
+            values = framed[0 if msb_first else 1] if framed is not None else None
+            candidates.append(
+                {
+                    "source_bitstream": {
+                        "origin": bitstream_meta[i]["origin"],
+                        "mapping": bitstream_meta[i]["mapping"],
+                    },
+                    "framing": {
+                        "frame_bits": frame_bits,
+                        "msb_first": msb_first,
+                        "offset": int(offset),
+                    },
+                    "printable_ratio": float(printable_ratio),
+                    "text_candidate": _ascii_text(values),
+                }
+            )
 
         # Normalized hypotheses
         hypotheses: List[Dict[str, Any]] = []
@@ -219,9 +305,7 @@ class AmplitudeModulationAmDecoder:
         artifacts: Dict[str, Any] = {
             "hypotheses": hypotheses,
             "raw": {
-                "bitstream_hypotheses": [
-                    {k: v for k, v in bs.items() if k != "bits"} for bs in bitstreams
-                ],
+                "bitstream_hypotheses": bitstream_meta,
                 "ascii_hypotheses": candidates,
             },
         }
@@ -247,8 +331,8 @@ class AmplitudeModulationAmDecoder:
             artifacts=artifacts,
             diagnostics=diagnostics,
             inputs_provenance={
-                "Δ": delta.provenance.__dict__,
-                "S": sym.provenance.__dict__,
-                "V": vec.provenance.__dict__,
+                "Δ": asdict(delta.provenance),
+                "S": asdict(sym.provenance),
+                "V": asdict(vec.provenance),
             },
         )
@@ -12,19 +12,48 @@ This decoder is a structural transformer:
 No interpretation is performed. Output is only structural artifacts.
 
 Expected input shape:
-- bundle.get("Δ").data == {"intervals": [float, float, ...]}
+- bundle.get("Δ").data == {"intervals": float64 ndarray (or list of numbers)}
   (as produced by sap2/grammar/builders/intervals.py)
 """
 
 from __future__ import annotations
 
+from dataclasses import asdict
 from typing import Any, Dict, List
 
+import numpy as np
+
 from sap2.decoders.base import Decoder, DecoderParams, refused, failure
 from sap2.model.experiment import ExperimentResult, ExperimentStatus
 from sap2.model.inputs import InputBundle
 
 
+# Symbol classes, indexing _SYMBOLS
+_DOT, _DASH, _AMBIGUOUS, _LETTER_SEP, _WORD_SEP = range(5)
+_SYMBOLS = np.array([".", "-", "?", "|", "/"])
+
+
+def _as_float_array(intervals: Any) -> np.ndarray:
+    """
+    Intervals as float64; values that cannot be read as a float become NaN,
+    which no threshold matches (they are binned as ambiguous).
+    """
+    try:
+        values = np.asarray(intervals, dtype=np.float64)
+        if values.ndim == 1:
+            return values
+    except (TypeError, ValueError):
+        pass
+
+    def _to_float(x: Any) -> float:
+        try:
+            return float(x)
+        except Exception:
+            return float("nan")
+
+    return np.array([_to_float(x) for x in intervals], dtype=np.float64)
+
+
 class DurationBasedMorseLikeDecoder(Decoder):
     """
     Maps each interval duration to:
@@ -67,11 +96,11 @@ class DurationBasedMorseLikeDecoder(Decoder):
             )
 
         intervals = delta.data.get("intervals")
-        if not isinstance(intervals, list):
+        if not isinstance(intervals, (list, np.ndarray)):
             return refused(
                 method_id=self.method_id,
                 version=self.version,
-                reason="Δ.data['intervals'] missing or invalid; expected a list of numbers.",
+                reason="Δ.data['intervals'] missing or invalid; expected an array or list of numbers.",
             )
 
         if len(intervals) == 0:
@@ -116,7 +145,7 @@ class DurationBasedMorseLikeDecoder(Decoder):
                 reason=f"Invalid parameters: dot_max ({dot_max}) must be < dash_min ({dash_min}).",
             )
 
-        if (letter_gap_minJMin_f is not None) and (letter_gap_min_f <= 0.0):
+        if (letter_gap_min_f is not None) and (letter_gap_min_f <= 0.0):
             return refused(
                 method_id=self.method_id,
                 version=self.version,
@@ -142,59 +171,33 @@ class DurationBasedMorseLikeDecoder(Decoder):
                 ),
             )
 
-        # Core transformation: intervals -> symbols
-        symbol_stream: List[str] = []
-        n_dot = 0
-        n_dash = 0
-        n_ambiguous = 0
-        n_letter_sep = 0
-        n_word_sep = 0
-
-        for x in intervals:
-            try:
-                d = float(x)
-            except Exception:
-                symbol_stream.append("?")
-                n_ambiguous += 1
-                continue
-
-            # Optional separators for large gaps (if enabled)
-            # Word gap has priority over letter gap.
-            if (word_gap_min_f is not None) and (d >= word_gap_min_f):
-                symbol_stream.append("/")
-                n_word_sep += 1
-                continue
-            if (letter_gap_min_f is not None) and (d >= letter_gap_min_f):
-                symbol_stream.append("|")
-                n_letter_sep += 1
-                continue
-
-            # Duration binning
-            if d <= dot_max:
-                symbol_stream.append(".")
-                n_dot += 1
-            elif d >= dash_min:
-                symbol_stream.append("-")
-                n_dash += 1
-            else:
-                symbol_stream.append("?")
-                n_ambiguous += 1
+        # Core transformation: intervals -> symbol classes
+        # Word gap has priority over letter gap, separators over duration binning.
+        values = _as_float_array(intervals)
+        conditions = [values <= dot_max, values >= dash_min]
+        choices = [_DOT, _DASH]
+        if letter_gap_min_f is not None:
+            conditions.insert(0, values >= letter_gap_min_f)
+            choices.insert(0, _LETTER_SEP)
+        if word_gap_min_f is not None:
+            conditions.insert(0, values >= word_gap_min_f)
+            choices.insert(0, _WORD_SEP)
+        classes = np.select(conditions, choices, default=_AMBIGUOUS)
+
+        counts = np.bincount(classes, minlength=len(_SYMBOLS)).tolist()
+        n_dot = counts[_DOT]
+        n_dash = counts[_DASH]
+        n_ambiguous = counts[_AMBIGUOUS]
+        n_letter_sep = counts[_LETTER_SEP]
+        n_word_sep = counts[_WORD_SEP]
+
+        symbol_stream: List[str] = _SYMBOLS[classes].tolist()
 
         # Secondary artifact: symbols -> bits
-        bitstream: List[int | None] = []
-        n_bits = 0
-        n_none = 0
-
-        for s in symbol_stream:
-            if s == ".":
-                bitstream.append(dot_bit)
-                n_bits += 1
-            elif s == "-":
-                bitstream.append(dash_bit)
-                n_bits += 1
-            else:
-                bitstream.append(None)
-                n_none += 1
+        bit_table = np.array([dot_bit, dash_bit, None, None, None], dtype=object)
+        bitstream: List[int | None] = bit_table[classes].tolist()
+        n_bits = n_dot + n_dash
+        n_none = len(bitstream) - n_bits
 
         diagnostics: List[str] = [
             f"Intervals transformed: {len(intervals)}",
@@ -250,7 +253,7 @@ class DurationBasedMorseLikeDecoder(Decoder):
 
         inputs_prov: Dict[str, Any] = {
             "Δ": {
-                "provenance": delta.provenance.__dict__ if getattr(delta, "provenance", None) else None,
+                "provenance": asdict(delta.provenance) if getattr(delta, "provenance", None) else None,
                 "metrics": delta.metrics,
             }
         }
@@ -18,6 +18,7 @@ def run_and_export(
     decoder_params_by_method: Optional[Mapping[str, Mapping[str, Any]]] = None,
     channels: Optional[list[str]] = None,
     report_title: str = "SAP² Report",
+    jobs: int = 1,
 ) -> PipelineRunResult:
     run = run_pipeline(
         sat_path=sat_path,
@@ -25,8 +26,18 @@ def run_and_export(
         applicability_params=params,
         decoder_params_by_method=decoder_params_by_method,
         channels=channels,
+        jobs=jobs,
     )
+    return export_run(run, out_dir, report_title=report_title)
 
+
+def export_run(
+    run: PipelineRunResult,
+    out_dir: str | Path,
+    *,
+    report_title: str = "SAP² Report",
+) -> PipelineRunResult:
+    """Write pipeline_run.json and report.md for an already computed run."""
     out_dir = Path(out_dir)
     out_dir.mkdir(parents=True, exist_ok=True)
 
@@ -13,22 +13,26 @@ No heuristics, no retries, no parameter scanning here.
 
 from __future__ import annotations
 
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Mapping, Optional
+from typing import Any, Dict, FrozenSet, Mapping, Optional
 
 from sap2.io.load_sat import SatResults
 from sap2.grammar.bundle_builder import build_all_channels
 
+from sap2.applicability.matrix import ApplicabilityMatrix
 from sap2.applicability.matrix_loader import load_applicability_matrix
 from sap2.applicability.params import ApplicabilityParams
 from sap2.applicability.checks import evaluate_all_methods, filter_applicable
 
-from sap2.decoders.registry import get_decoder
-from sap2.decoders.base import DecoderParams, refused
+from sap2.decoders.registry import get_decoder, implemented_method_ids
+from sap2.decoders.base import Decoder, DecoderParams, refused
 
 from sap2.model.applicability import ApplicabilityReport
 from sap2.model.experiment import ExperimentResult
+from sap2.model.inputs import InputBundle
 
 
 @dataclass(frozen=True)
@@ -52,6 +56,8 @@ def run_pipeline(
     decoder_params_by_method: Optional[Mapping[str, Mapping[str, Any]]] = None,
     *,
     channels: Optional[list[str]] = None,
+    skip_unimplemented: bool = False,
+    jobs: int = 1,
 ) -> PipelineRunResult:
     """
     Run SAP² end-to-end pipeline.
@@ -68,51 +74,77 @@ def run_pipeline(
         channels:
             Optional allow-list of channel names to run (e.g. ["left", "right"]).
             If None: run all channels produced by build_all_channels().
+        skip_unimplemented:
+            If True, only methods with a registered decoder are evaluated; the
+            applicability reports then omit every other method of the matrix.
+            Default False: the full matrix is reported.
+        jobs:
+            Worker processes for the per-channel work (applicability + decoders),
+            one channel per process. Default 1: channels run sequentially in
+            this process. The result does not depend on this value.
+            Must be >= 1.
 
     Returns:
         PipelineRunResult containing applicability reports and experiment results per channel.
+
+    Raises:
+        ValueError: If jobs < 1
     """
+    if jobs < 1:
+        raise ValueError(f"jobs must be >= 1 (got {jobs})")
+
     sat = SatResults.load(sat_path)
     matrix = load_applicability_matrix(matrices_dir)
 
-    bundles_by_channel = build_all_channels(sat)
+    # Families that no method of the matrix uses are not built at all.
+    bundles_by_channel = build_all_channels(sat, families=matrix.get_used_input_families())
 
     if channels is not None:
         allow = set(channels)
         bundles_by_channel = {ch: b for ch, b in bundles_by_channel.items() if ch in allow}
 
     decoder_params_by_method = decoder_params_by_method or {}
-
-    out_channels: Dict[str, PipelineChannelResult] = {}
-
-    for channel_name, bundle in bundles_by_channel.items():
-        reports = evaluate_all_methods(matrix=matrix, bundle=bundle, params=applicability_params)
-        applicable = filter_applicable(reports)
-
-        experiments: Dict[str, ExperimentResult] = {}
-
-        for method_id in applicable.keys():
-            dec = get_decoder(method_id)
-
-            if dec is None:
-                # Not implemented is not an error; represent as a factual refusal.
-                experiments[method_id] = refused(
-                    method_id=method_id,
-                    version="registry",
-                    reason=f"Decoder not implemented for method_id '{method_id}'.",
+    method_ids = implemented_method_ids() if skip_unimplemented else None
+
+    # Decoder lookup done once per run instead of once per (channel, method).
+    decoders_by_method: Dict[str, Decoder] = {}
+    for method_id in matrix.methods:
+        dec = get_decoder(method_id)
+        if dec is not None:
+            decoders_by_method[method_id] = dec
+
+    if jobs > 1 and len(bundles_by_channel) > 1:
+        # Channels share no mutable state: one worker process per channel.
+        # Results are collected in channel order, as a sequential run would.
+        max_workers = min(jobs, len(bundles_by_channel), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as ex:
+            futures = {
+                channel_name: ex.submit(
+                    _run_channel,
+                    channel_name,
+                    bundle,
+                    matrix,
+                    applicability_params,
+                    decoder_params_by_method,
+                    decoders_by_method,
+                    method_ids,
                 )
-                continue
-
-            raw_params = decoder_params_by_method.get(method_id, {})
-            params = DecoderParams(values=dict(raw_params))
-
-            experiments[method_id] = dec.decode(bundle=bundle, params=params)
-
-        out_channels[channel_name] = PipelineChannelResult(
-            channel=channel_name,
-            applicability=reports,
-            experiments=experiments,
-        )
+                for channel_name, bundle in bundles_by_channel.items()
+            }
+            out_channels = {ch: f.result() for ch, f in futures.items()}
+    else:
+        out_channels = {
+            channel_name: _run_channel(
+                channel_name,
+                bundle,
+                matrix,
+                applicability_params,
+                decoder_params_by_method,
+                decoders_by_method,
+                method_ids,
+            )
+            for channel_name, bundle in bundles_by_channel.items()
+        }
 
     # SatResults has .source_path in your implementation; fallback is the input path string.
     sat_source = str(getattr(sat, "source_path", sat_path))
@@ -123,3 +155,47 @@ def run_pipeline(
         matrix_schema_version=matrix_schema_version,
         channels=out_channels,
     )
+
+
+def _run_channel(
+    channel_name: str,
+    bundle: InputBundle,
+    matrix: ApplicabilityMatrix,
+    applicability_params: ApplicabilityParams,
+    decoder_params_by_method: Mapping[str, Mapping[str, Any]],
+    decoders_by_method: Mapping[str, Decoder],
+    method_ids: Optional[FrozenSet[str]],
+) -> PipelineChannelResult:
+    """Applicability evaluation and decoding of one channel's InputBundle."""
+    reports = evaluate_all_methods(
+        matrix=matrix,
+        bundle=bundle,
+        params=applicability_params,
+        method_ids=method_ids,
+    )
+    applicable = filter_applicable(reports)
+
+    experiments: Dict[str, ExperimentResult] = {}
+
+    for method_id in applicable.keys():
+        dec = decoders_by_method.get(method_id)
+
+        if dec is None:
+            # Not implemented is not an error; represent as a factual refusal.
+            experiments[method_id] = refused(
+                method_id=method_id,
+                version="registry",
+                reason=f"Decoder not implemented for method_id '{method_id}'.",
+            )
+            continue
+
+        raw_params = decoder_params_by_method.get(method_id, {})
+        params = DecoderParams(values=dict(raw_params))
+
+        experiments[method_id] = dec.decode(bundle=bundle, params=params)
+
+    return PipelineChannelResult(
+        channel=channel_name,
+        applicability=reports,
+        experiments=experiments,
+    )
@@ -6,8 +6,10 @@ No hidden thresholds. No implicit quality assessment.
 """
 
 
+from typing import Any, Dict, Optional
+
 from sap2.io.load_sat import SatResults
-from sap2.model.inputs import Input, Provenance
+from sap2.model.inputs import FAMILY_E, Input, Provenance
 
 
 def build_events(sat: SatResults, channel: str) -> Input:
@@ -25,6 +27,26 @@ def build_events(sat: SatResults, channel: str) -> Input:
     """
     
     pulse = sat.get_method('pulse_detection', channel)
+    pulse_params = sat.get_method_metrics('pulse_detection') if pulse is not None else None
+    
+    return events_from_pulse_detection(pulse, pulse_params)
+
+
+def events_from_pulse_detection(
+    pulse: Optional[Dict[str, Any]],
+    pulse_params: Optional[Dict[str, Any]]
+) -> Input:
+    """
+    Build the E (Events) family from already-fetched pulse_detection data.
+    
+    Used by build_events() and by the fused pulse builder
+    (sap2/grammar/builders/pulses.py), which fetches pulse_detection once
+    for E, Δ and S.
+    
+    Args:
+        pulse: pulse_detection measurements for the channel (None if not run)
+        pulse_params: pulse_detection metrics (SAT parameters), if any
+    """
     
     # Build provenance
     sat_methods = []
@@ -32,9 +54,8 @@ def build_events(sat: SatResults, channel: str) -> Input:
     
     if pulse is not None:
         sat_methods.append('pulse_detection')
-        params = sat.get_method_metrics('pulse_detection')
-        if params:
-            sat_params['pulse_detection'] = params
+        if pulse_params:
+            sat_params['pulse_detection'] = pulse_params
     
     provenance = Provenance.create(
         sat_methods=sat_methods,
@@ -44,8 +65,8 @@ def build_events(sat: SatResults, channel: str) -> Input:
     
     # If method not run
     if pulse is None:
-        return Input(
-            family='E',
+        return Input._unchecked(
+            family=FAMILY_E,
             available=False,
             data=None,
             provenance=provenance,
@@ -72,8 +93,8 @@ def build_events(sat: SatResults, channel: str) -> Input:
     if num_pulses < 2:
         notes.append(f'only {num_pulses} event(s), need ≥2 for intervals')
     
-    return Input(
-        family='E',
+    return Input._unchecked(
+        family=FAMILY_E,
         available=available,
         data={'positions': positions},
         provenance=provenance,
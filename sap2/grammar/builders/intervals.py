@@ -4,10 +4,48 @@ Intervals Builder (Δ family) - sap2/grammar/builders/intervals.py
 ETHICAL PRINCIPLE: OBSERVE ONLY. Do not judge.
 """
 
+from typing import Any, Dict, Optional, Tuple
+
 import numpy as np
 
 from sap2.io.load_sat import SatResults
-from sap2.model.inputs import Input, Provenance
+from sap2.model.inputs import FAMILY_DELTA, Input, Provenance
+
+
+def pulse_intervals(positions: Any) -> np.ndarray:
+    """
+    Intervals between consecutive pulse positions, as a contiguous float64 ndarray.
+    
+    Positions are checked before the float64 conversion, which would
+    otherwise turn None into NaN and numeric strings into numbers silently.
+    
+    Raises:
+        TypeError: If positions are not a flat sequence of numbers
+        ValueError: If a position is NaN or infinite
+    """
+    values = np.asarray(positions)
+    if values.ndim != 1 or values.dtype.kind not in 'iuf':
+        raise TypeError(
+            f"pulse_positions must be a flat list of numbers, got {positions!r:.80}"
+        )
+    values = values.astype(np.float64, copy=False)
+    if not np.isfinite(values).all():
+        raise ValueError(f"pulse_positions must be finite, got {positions!r:.80}")
+    return np.diff(values)
+
+
+def _interval_stats(intervals: np.ndarray) -> Tuple[float, float, float, float]:
+    """
+    Compute (mean, std, min, max) of the intervals.
+    
+    np.std would recompute the mean internally; the population standard
+    deviation is derived here from the mean already computed, with the same
+    float64 accumulation as np.std, so the values are unchanged.
+    """
+    mean = np.mean(intervals)
+    deviations = intervals - mean
+    std = np.sqrt(np.sum(deviations * deviations) / intervals.size)
+    return (float(mean), float(std), float(np.min(intervals)), float(np.max(intervals)))
 
 
 def build_intervals(sat: SatResults, channel: str) -> Input:
@@ -16,7 +54,7 @@ def build_intervals(sat: SatResults, channel: str) -> Input:
     
     Returns Input with:
     - available: True if ≥1 interval exists
-    - data: computed intervals
+    - data: computed intervals (float64 ndarray)
     - metrics: mean, std, cv (FACTUAL, no threshold)
     - provenance: complete traceability
     
@@ -25,6 +63,28 @@ def build_intervals(sat: SatResults, channel: str) -> Input:
     """
     
     pulse = sat.get_method('pulse_detection', channel)
+    pulse_params = sat.get_method_metrics('pulse_detection') if pulse is not None else None
+    
+    return intervals_from_pulse_detection(pulse, pulse_params)
+
+
+def intervals_from_pulse_detection(
+    pulse: Optional[Dict[str, Any]],
+    pulse_params: Optional[Dict[str, Any]],
+    intervals: Optional[np.ndarray] = None
+) -> Input:
+    """
+    Build the Δ (Intervals) family from already-fetched pulse_detection data.
+    
+    Used by build_intervals() and by the fused pulse builder
+    (sap2/grammar/builders/pulses.py), which fetches pulse_detection once
+    for E, Δ and S.
+    
+    Args:
+        pulse: pulse_detection measurements for the channel (None if not run)
+        pulse_params: pulse_detection metrics (SAT parameters), if any
+        intervals: Precomputed float64 np.diff(pulse_positions), if available
+    """
     
     # Build provenance
     sat_methods = []
@@ -32,9 +92,8 @@ def build_intervals(sat: SatResults, channel: str) -> Input:
     
     if pulse is not None:
         sat_methods.append('pulse_detection')
-        params = sat.get_method_metrics('pulse_detection')
-        if params:
-            sat_params['pulse_detection'] = params
+        if pulse_params:
+            sat_params['pulse_detection'] = pulse_params
     
     provenance = Provenance.create(
         sat_methods=sat_methods,
@@ -44,8 +103,8 @@ def build_intervals(sat: SatResults, channel: str) -> Input:
     
     # If method not run
     if pulse is None:
-        return Input(
-            family='Δ',
+        return Input._unchecked(
+            family=FAMILY_DELTA,
             available=False,
             data=None,
             provenance=provenance,
@@ -57,8 +116,8 @@ def build_intervals(sat: SatResults, channel: str) -> Input:
     positions = pulse.get('pulse_positions', [])
     
     if len(positions) < 2:
-        return Input(
-            family='Δ',
+        return Input._unchecked(
+            family=FAMILY_DELTA,
             available=False,
             data=None,
             provenance=provenance,
@@ -67,29 +126,31 @@ def build_intervals(sat: SatResults, channel: str) -> Input:
         )
     
     # Compute intervals
-    intervals = np.diff(positions)
+    # Kept as a contiguous float64 ndarray in Input.data; conversion to a list
+    # happens only at the JSON boundary (sap2.render.json.to_jsonable).
+    if intervals is None:
+        intervals = pulse_intervals(positions)
     
     # FACTUAL metrics (no thresholds)
-    mean = float(np.mean(intervals))
-    std = float(np.std(intervals))
+    mean, std, minimum, maximum = _interval_stats(intervals)
     cv = std / mean if mean > 0 else 0.0  # Factual metric, not a judgment
     
     metrics = {
         'num_intervals': float(len(intervals)),
         'interval_mean': mean,
         'interval_std': std,
-        'interval_min': float(np.min(intervals)),
-        'interval_max': float(np.max(intervals)),
+        'interval_min': minimum,
+        'interval_max': maximum,
         'coefficient_of_variation': cv
     }
     
     # Factual availability
     available = (len(intervals) >= 1)
     
-    return Input(
-        family='Δ',
+    return Input._unchecked(
+        family=FAMILY_DELTA,
         available=available,
-        data={'intervals': intervals.tolist()},
+        data={'intervals': intervals},
         provenance=provenance,
         metrics=metrics,
         notes=[]
@@ -9,7 +9,7 @@ This is documented in provenance and notes.
 
 
 from sap2.io.load_sat import SatResults
-from sap2.model.inputs import Input, Provenance
+from sap2.model.inputs import FAMILY_M, Input, Provenance
 
 
 def build_matrices(sat: SatResults, channel: str) -> Input:
@@ -47,7 +47,7 @@ def build_matrices(sat: SatResults, channel: str) -> Input:
     
     # Band stability (frequency bands × time)
     band_stab = sat.get_method('band_stability', channel)
-    if band_stab and isinstance(band_stab, dict):
+    if band_stab:
         sat_methods.append('band_stability')
         params = sat.get_method_metrics('band_stability')
         if params:
@@ -87,8 +87,8 @@ def build_matrices(sat: SatResults, channel: str) -> Input:
     
     # If no proxies
     if not proxies:
-        return Input(
-            family='M',
+        return Input._unchecked(
+            family=FAMILY_M,
             available=False,
             data=None,
             provenance=provenance,
@@ -110,8 +110,8 @@ def build_matrices(sat: SatResults, channel: str) -> Input:
     # Factual availability
     available = (num_proxies >= 1)
     
-    return Input(
-        family='M',
+    return Input._unchecked(
+        family=FAMILY_M,
         available=available,
         data={'proxies': proxies},
         provenance=provenance,
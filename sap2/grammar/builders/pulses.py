@@ -0,0 +1,49 @@
+"""
+Pulse Families Builder (E, Δ, S) - sap2/grammar/builders/pulses.py
+
+E, Δ and S are all derived from SAT pulse_detection.
+This builder fetches pulse_detection once and computes the intervals once,
+then delegates to the per-family builders (events, intervals, symbols).
+
+ETHICAL PRINCIPLE: OBSERVE ONLY. Same outputs as the individual builders.
+"""
+
+from typing import Tuple
+
+from sap2.io.load_sat import SatResults
+from sap2.model.inputs import FAMILY_E, FAMILY_DELTA, FAMILY_S, Input
+from sap2.grammar.builders.events import events_from_pulse_detection
+from sap2.grammar.builders.intervals import intervals_from_pulse_detection, pulse_intervals
+from sap2.grammar.builders.symbols import symbols_from_pulse_detection
+
+
+# Families produced by build_pulse_families, in return order
+PULSE_FAMILIES = (FAMILY_E, FAMILY_DELTA, FAMILY_S)
+
+
+def build_pulse_families(sat: SatResults, channel: str) -> Tuple[Input, Input, Input]:
+    """
+    Build E (Events), Δ (Intervals) and S (Symbols) in one pass.
+    
+    Equivalent to (build_events, build_intervals, build_symbols) called
+    separately, without the repeated pulse_detection lookups and np.diff.
+    
+    Returns:
+        (E, Δ, S) Inputs
+    """
+    
+    pulse = sat.get_method('pulse_detection', channel)
+    pulse_params = sat.get_method_metrics('pulse_detection') if pulse is not None else None
+    
+    # Shared intervals (only meaningful with ≥2 events)
+    intervals = None
+    if pulse is not None:
+        positions = pulse.get('pulse_positions', [])
+        if len(positions) >= 2:
+            intervals = pulse_intervals(positions)
+    
+    return (
+        events_from_pulse_detection(pulse, pulse_params),
+        intervals_from_pulse_detection(pulse, pulse_params, intervals),
+        symbols_from_pulse_detection(pulse, pulse_params, intervals),
+    )
@@ -6,7 +6,7 @@ ETHICAL PRINCIPLE: Aggregate all available relations. No judgment.
 
 
 from sap2.io.load_sat import SatResults
-from sap2.model.inputs import Input, Provenance
+from sap2.model.inputs import FAMILY_R, Input, Provenance
 
 
 RELATION_METHODS = [
@@ -29,6 +29,8 @@ def build_relations(sat: SatResults, channel: str = None) -> Input:
     
     NO JUDGMENT about quantity or quality of relations.
     
+    Measurements are dicts of dicts; SatResults validates this at load.
+    
     Note:
         This builder ALWAYS checks for global relations (pairs like left_vs_right)
         in addition to any channel-specific relations.
@@ -55,18 +57,18 @@ def build_relations(sat: SatResults, channel: str = None) -> Input:
         # ALWAYS also check for global pairs
         # (Prevents missing left_vs_right etc. when channel is specified)
         all_data = sat.get_method(method_name)
-        if all_data and isinstance(all_data, dict):
+        if all_data:
             # Check if this has pair-like keys
-            has_pairs = any('_vs_' in str(k) for k in all_data.keys())
+            # (one substring scan over the NUL-joined keys; '_vs_' cannot span a NUL)
+            has_pairs = '_vs_' in '\0'.join(map(str, all_data))
             
             if has_pairs:
                 # Merge instead of overwrite
                 if method_name in relations:
                     # Already have channel-specific, merge with global pairs
-                    if isinstance(relations[method_name], dict):
-                        # Merge: channel-specific takes precedence (overwrites global on conflict)
-                        merged = {**all_data, **relations[method_name]}
-                        relations[method_name] = merged
+                    # Merge: channel-specific takes precedence (overwrites global on conflict)
+                    merged = {**all_data, **relations[method_name]}
+                    relations[method_name] = merged
                 else:
                     # No channel-specific data yet, use global pairs
                     if method_name not in sat_methods:
@@ -85,8 +87,8 @@ def build_relations(sat: SatResults, channel: str = None) -> Input:
     
     # If no relations
     if not relations:
-        return Input(
-            family='R',
+        return Input._unchecked(
+            family=FAMILY_R,
             available=False,
             data=None,
             provenance=provenance,
@@ -104,8 +106,8 @@ def build_relations(sat: SatResults, channel: str = None) -> Input:
     # Factual availability
     available = (num_types >= 1)
     
-    return Input(
-        family='R',
+    return Input._unchecked(
+        family=FAMILY_R,
         available=available,
         data={'relations': relations},
         provenance=provenance,
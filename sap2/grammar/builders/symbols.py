@@ -5,10 +5,13 @@ ETHICAL PRINCIPLE: Discretization is EXPLICIT and DOCUMENTED.
 No hidden judgment on distribution balance.
 """
 
+from typing import Any, Dict, Optional
+
 import numpy as np
 
 from sap2.io.load_sat import SatResults
-from sap2.model.inputs import Input, Provenance
+from sap2.model.inputs import FAMILY_S, Input, Provenance
+from sap2.grammar.builders.intervals import pulse_intervals
 
 
 def build_symbols(sat: SatResults, channel: str) -> Input:
@@ -29,6 +32,28 @@ def build_symbols(sat: SatResults, channel: str) -> Input:
     """
     
     pulse = sat.get_method('pulse_detection', channel)
+    pulse_params = sat.get_method_metrics('pulse_detection') if pulse is not None else None
+    
+    return symbols_from_pulse_detection(pulse, pulse_params)
+
+
+def symbols_from_pulse_detection(
+    pulse: Optional[Dict[str, Any]],
+    pulse_params: Optional[Dict[str, Any]],
+    intervals: Optional[np.ndarray] = None
+) -> Input:
+    """
+    Build the S (Symbols) family from already-fetched pulse_detection data.
+    
+    Used by build_symbols() and by the fused pulse builder
+    (sap2/grammar/builders/pulses.py), which fetches pulse_detection once
+    for E, Δ and S.
+    
+    Args:
+        pulse: pulse_detection measurements for the channel (None if not run)
+        pulse_params: pulse_detection metrics (SAT parameters), if any
+        intervals: Precomputed float64 np.diff(pulse_positions), if available
+    """
     
     # Build provenance (includes discretization params)
     sat_methods = []
@@ -36,9 +61,8 @@ def build_symbols(sat: SatResults, channel: str) -> Input:
     
     if pulse is not None:
         sat_methods.append('pulse_detection')
-        params = sat.get_method_metrics('pulse_detection')
-        if params:
-            sat_params['pulse_detection'] = params
+        if pulse_params:
+            sat_params['pulse_detection'] = pulse_params
     
     # Document discretization method
     sat_params['discretization'] = {
@@ -54,8 +78,8 @@ def build_symbols(sat: SatResults, channel: str) -> Input:
     
     # If method not run
     if pulse is None:
-        return Input(
-            family='S',
+        return Input._unchecked(
+            family=FAMILY_S,
             available=False,
             data=None,
             provenance=provenance,
@@ -67,8 +91,8 @@ def build_symbols(sat: SatResults, channel: str) -> Input:
     positions = pulse.get('pulse_positions', [])
     
     if len(positions) < 3:
-        return Input(
-            family='S',
+        return Input._unchecked(
+            family=FAMILY_S,
             available=False,
             data=None,
             provenance=provenance,
@@ -77,16 +101,19 @@ def build_symbols(sat: SatResults, channel: str) -> Input:
         )
     
     # Compute intervals and discretize
-    intervals = np.diff(positions)
+    if intervals is None:
+        intervals = pulse_intervals(positions)
     threshold = float(np.median(intervals))
     
     alphabet = ['short', 'long']
-    symbols = [alphabet[0] if i < threshold else alphabet[1] for i in intervals]
+    is_short = intervals < threshold
+    symbols = np.where(is_short, alphabet[0], alphabet[1]).tolist()
     
     # FACTUAL distribution metrics (no judgment)
-    short_count = symbols.count('short')
-    long_count = symbols.count('long')
-    total = len(symbols)
+    # Counted on the boolean mask, not by scanning the string list
+    total = int(is_short.size)
+    short_count = int(np.count_nonzero(is_short))
+    long_count = total - short_count
     
     # Shannon entropy (factual)
     p_short = short_count / total if total > 0 else 0
@@ -99,7 +126,7 @@ def build_symbols(sat: SatResults, channel: str) -> Input:
         entropy += -p_long * np.log2(p_long)
     
     metrics = {
-        'num_symbols': float(len(symbols)),
+        'num_symbols': float(total),
         'symbol_entropy': float(entropy),
         'ratio_short': p_short,
         'ratio_long': p_long,
@@ -107,10 +134,10 @@ def build_symbols(sat: SatResults, channel: str) -> Input:
     }
     
     # Factual availability
-    available = (len(symbols) >= 2)
+    available = (total >= 2)
     
-    return Input(
-        family='S',
+    return Input._unchecked(
+        family=FAMILY_S,
         available=available,
         data={
             'symbols': symbols,
@@ -6,7 +6,7 @@ ETHICAL PRINCIPLE: Aggregate all available sources. No judgment on quantity.
 
 
 from sap2.io.load_sat import SatResults
-from sap2.model.inputs import Input, Provenance
+from sap2.model.inputs import FAMILY_V, Input, Provenance
 
 
 # Explicit mapping of SAT methods to vector features
@@ -64,8 +64,8 @@ def build_vectors(sat: SatResults, channel: str) -> Input:
     
     # If no vectors
     if not vectors:
-        return Input(
-            family='V',
+        return Input._unchecked(
+            family=FAMILY_V,
             available=False,
             data=None,
             provenance=provenance,
@@ -85,8 +85,8 @@ def build_vectors(sat: SatResults, channel: str) -> Input:
     # Factual availability
     available = (num_sources >= 1)
     
-    return Input(
-        family='V',
+    return Input._unchecked(
+        family=FAMILY_V,
         available=available,
         data={'vectors': vectors},
         provenance=provenance,
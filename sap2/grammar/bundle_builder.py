@@ -4,53 +4,104 @@ Bundle Builder - sap2/grammar/bundle_builder.py
 Orchestrates all 6 grammar builders to produce complete InputBundle.
 """
 
+from typing import Callable, Collection, Dict, Optional
 
 from sap2.io.load_sat import SatResults
-from sap2.model.inputs import InputBundle
-from sap2.grammar.builders.events import build_events
-from sap2.grammar.builders.intervals import build_intervals
-from sap2.grammar.builders.symbols import build_symbols
+from sap2.model.inputs import FAMILY_V, FAMILY_M, FAMILY_R, Input, InputBundle, Provenance
+from sap2.grammar.builders.pulses import PULSE_FAMILIES, build_pulse_families
 from sap2.grammar.builders.vectors import build_vectors
 from sap2.grammar.builders.matrices import build_matrices
 from sap2.grammar.builders.relations import build_relations
 
 
-def build_input_bundle(sat: SatResults, channel: str) -> InputBundle:
+# Family → builder for the families not derived from pulse_detection.
+# E, Δ and S are built together by build_pulse_families.
+_BUILDERS: Dict[str, Callable[[SatResults, str], Input]] = {
+    FAMILY_V: build_vectors,
+    FAMILY_M: build_matrices,
+    FAMILY_R: build_relations,
+}
+
+
+def build_input_bundle(
+    sat: SatResults,
+    channel: str,
+    families: Optional[Collection[str]] = None
+) -> InputBundle:
     """
     Build complete InputBundle for a channel.
     
-    Runs all 6 grammar builders and assembles their outputs.
+    Runs the grammar builders and assembles their outputs
+    (E, Δ, S come from one fused pulse_detection pass).
     Each builder observes and documents without judgment.
     
     Args:
         sat: SatResults instance
         channel: Channel name ('left', 'right', 'difference', etc.)
+        families: Optional subset of families to build (e.g. the families
+                  used by at least one method of the applicability matrix).
+                  If None: all 6 families are built.
+                  Families outside the subset are NOT built: they are
+                  represented by an unavailable Input that says so explicitly.
         
     Returns:
         InputBundle with all 6 families (E, Δ, S, V, M, R)
     """
     
-    return InputBundle(
-        inputs={
-            'E': build_events(sat, channel),
-            'Δ': build_intervals(sat, channel),
-            'S': build_symbols(sat, channel),
-            'V': build_vectors(sat, channel),
-            'M': build_matrices(sat, channel),
-            'R': build_relations(sat, channel)
-        },
-        channel=channel
-    )
+    inputs = {}
+    
+    def wanted(family: str) -> bool:
+        return families is None or family in families
+    
+    # E, Δ, S share one pulse_detection fetch and one interval computation
+    if any(wanted(family) for family in PULSE_FAMILIES):
+        pulse_inputs = build_pulse_families(sat, channel)
+        for family, inp in zip(PULSE_FAMILIES, pulse_inputs):
+            inputs[family] = inp if wanted(family) else _not_built(family)
+    else:
+        for family in PULSE_FAMILIES:
+            inputs[family] = _not_built(family)
+    
+    for family, builder in _BUILDERS.items():
+        if wanted(family):
+            inputs[family] = builder(sat, channel)
+        else:
+            inputs[family] = _not_built(family)
+    
+    return InputBundle(inputs=inputs, channel=channel)
 
 
-def build_all_channels(sat: SatResults) -> dict:
+def build_all_channels(
+    sat: SatResults,
+    families: Optional[Collection[str]] = None
+) -> dict:
     """
     Build InputBundles for all available channels.
     
+    Args:
+        sat: SatResults instance
+        families: Optional subset of families to build (see build_input_bundle)
+    
     Returns:
         Dict mapping channel_name -> InputBundle
     """
     return {
-        channel: build_input_bundle(sat, channel)
+        channel: build_input_bundle(sat, channel, families)
         for channel in sat.channels
-    }
\ No newline at end of file
+    }
+
+
+def _not_built(family: str) -> Input:
+    """Placeholder for a family that was deliberately not built."""
+    return Input._unchecked(
+        family=family,
+        available=False,
+        data=None,
+        provenance=Provenance.create(
+            sat_methods=[],
+            sat_params={},
+            builder_version='1.0.0'
+        ),
+        metrics={},
+        notes=['not built: no method in the applicability matrix uses this family']
+    )
@@ -8,10 +8,18 @@ Provides a clean API for accessing measurements by method and channel.
 from __future__ import annotations
 
 import json
+import sys
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 from dataclasses import dataclass
 
+# orjson is an optional accelerator for parsing results.json.
+try:
+    import orjson
+except ImportError:  # optional dependency not installed
+    orjson = None
+
 
 class SatLoadError(RuntimeError):
     """Raised when SAT results cannot be loaded or are invalid."""
@@ -59,13 +67,20 @@ class SatResults:
         19
     """
     
-    def __init__(self, data: Dict[str, Any], source_path: Optional[Path] = None):
+    def __init__(
+        self,
+        data: Dict[str, Any],
+        source_path: Optional[Path] = None,
+        *,
+        _skip_validate: bool = False,
+    ):
         """
         Initialize from parsed JSON data.
         
         Args:
             data: Parsed results.json content
             source_path: Optional path to the source file (for provenance)
+            _skip_validate: Internal; use SatResults.from_trusted instead
         """
         self._data = data
         self._source_path = source_path
@@ -75,10 +90,28 @@ class SatResults:
         self._results = data.get('results', {})
         
         # Validate structure
-        self._validate()
+        if not _skip_validate:
+            self._validate()
         
         # Build indices for fast lookup
         self._build_indices()
+        
+        # get_all_for_channel results, per channel
+        self._channel_measurements: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    
+    @classmethod
+    def from_trusted(
+        cls, data: Dict[str, Any], source_path: Optional[Path] = None
+    ) -> SatResults:
+        """
+        Build from data already known to satisfy the results.json contract.
+        
+        Skips the structural validation walk; only the indices are built.
+        Intended for data that went through SatResults validation before
+        (e.g. `sat._data` of an existing instance). Untrusted input must go
+        through the constructor or `load`.
+        """
+        return cls(data, source_path=source_path, _skip_validate=True)
     
     @classmethod
     def load(cls, path: Path | str) -> SatResults:
@@ -94,16 +127,7 @@ class SatResults:
         Raises:
             SatLoadError: If file cannot be loaded or is invalid
         """
-        path = Path(path)
-        
-        # If directory, look for results.json inside
-        if path.is_dir():
-            candidate = path / 'results.json'
-            if not candidate.exists():
-                raise SatLoadError(
-                    f"Directory does not contain results.json: {path}"
-                )
-            path = candidate
+        path = _resolve_results_path(Path(path))
         
         # Load JSON
         if not path.exists():
@@ -113,8 +137,7 @@ class SatResults:
             raise SatLoadError(f"Not a file: {path}")
         
         try:
-            with path.open('r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = _parse_json(path.read_bytes())
         except json.JSONDecodeError as e:
             raise SatLoadError(f"Invalid JSON in {path}: {e}") from e
         except Exception as e:
@@ -142,17 +165,58 @@ class SatResults:
                 raise SatLoadError(
                     f"results.{family_name} must be a list, got {type(family_data)}"
                 )
+            
+            for i, result_entry in enumerate(family_data):
+                self._validate_entry(result_entry, f"results.{family_name}[{i}]")
+    
+    @staticmethod
+    def _validate_entry(result_entry: Any, where: str) -> None:
+        """
+        Validate the measurement contract of one result entry.
+        
+        Builders rely on it: measurements is a dict mapping channel (or channel
+        pair, e.g. 'left_vs_right') to a dict of measured values.
+        """
+        if not isinstance(result_entry, dict):
+            raise SatLoadError(f"{where} must be a dictionary, got {type(result_entry)}")
+        
+        measurements = result_entry.get('measurements', {})
+        if not isinstance(measurements, dict):
+            raise SatLoadError(
+                f"{where}.measurements must be a dictionary, got {type(measurements)}"
+            )
+        
+        for channel, values in measurements.items():
+            if not isinstance(values, dict):
+                raise SatLoadError(
+                    f"{where}.measurements.{channel} must be a dictionary, got {type(values)}"
+                )
     
     def _build_indices(self) -> None:
-        """Build internal indices for fast method lookup"""
+        """Build internal indices for fast method lookup (one pass over results)"""
         self._method_index: Dict[str, Dict[str, Any]] = {}
+        self._families: Dict[str, List[str]] = {}
+        self._method_channels: Dict[str, FrozenSet[str]] = {}
         
-        # Index: method_name -> result entry
+        # Family, method and channel names recur in every lookup; they are
+        # interned so index hits compare by identity first.
         for family_name, family_results in self._results.items():
+            methods = []
             for result_entry in family_results:
                 method = result_entry.get('method')
                 if method:
+                    if isinstance(method, str):
+                        method = sys.intern(method)
+                    # Index: method_name -> result entry (last entry wins)
                     self._method_index[method] = result_entry
+                    self._method_channels[method] = frozenset(
+                        map(sys.intern, result_entry.get('measurements', {}).keys())
+                    )
+                    methods.append(method)
+            if methods:
+                self._families[sys.intern(family_name)] = methods
+        
+        self._method_names: Tuple[str, ...] = tuple(self._method_index)
     
     # ========================================================================
     # Properties - Metadata Access
@@ -173,20 +237,20 @@ class SatResults:
         """Sample rate in Hz"""
         return self._metadata.get('sample_rate', 44100)
     
-    @property
+    @cached_property
     def channels(self) -> List[str]:
         """List of analyzed channels (e.g. ['left', 'right', 'difference'])"""
         return self._metadata.get('channels', ['left', 'right'])
     
-    @property
+    @cached_property
     def duration(self) -> float:
-        """Duration of audio in seconds"""
+        """Duration of audio in seconds (as recorded by SAT)"""
         audio_info = self._metadata.get('audio_info', {})
         return audio_info.get('duration', 0.0)
     
-    @property
+    @cached_property
     def audio_info(self) -> AudioInfo:
-        """Structured audio metadata"""
+        """Structured audio metadata (built once)"""
         audio_info_dict = self._metadata.get('audio_info', {})
         return AudioInfo.from_dict(audio_info_dict)
     
@@ -200,7 +264,7 @@ class SatResults:
         """SAT config version"""
         return self._metadata.get('config_version', 'unknown')
     
-    @property
+    @cached_property
     def preprocessing(self) -> Dict[str, Any]:
         """Preprocessing settings used"""
         return self._metadata.get('preprocessing', {})
@@ -273,14 +337,14 @@ class SatResults:
         """
         return method_name in self._method_index
     
-    def list_methods(self) -> List[str]:
+    def list_methods(self) -> Tuple[str, ...]:
         """
         List all methods that were run.
         
         Returns:
-            List of method names
+            Tuple of method names (precomputed when the results are indexed)
         """
-        return list(self._method_index.keys())
+        return self._method_names
     
     def list_methods_by_family(self) -> Dict[str, List[str]]:
         """
@@ -297,23 +361,15 @@ class SatResults:
                 ...
             }
         """
-        families: Dict[str, List[str]] = {}
-        
-        for family_name, family_results in self._results.items():
-            methods = []
-            for result_entry in family_results:
-                method = result_entry.get('method')
-                if method:
-                    methods.append(method)
-            if methods:
-                families[family_name] = methods
-        
-        return families
+        return {family_name: list(methods) for family_name, methods in self._families.items()}
     
     def get_all_for_channel(self, channel: str) -> Dict[str, Dict[str, Any]]:
         """
         Get all measurements for a specific channel.
         
+        Computed once per channel; the returned dict is shared and must not
+        be mutated.
+        
         Args:
             channel: Channel name
             
@@ -325,20 +381,24 @@ class SatResults:
             >>> left_data['pulse_detection']['num_pulses']
             19
         """
+        cached = self._channel_measurements.get(channel)
+        if cached is not None:
+            return cached
+        
         result = {}
         
-        for method_name in self._method_index.keys():
-            measurements = self.get_method(method_name, channel)
+        for method_name, result_entry in self._method_index.items():
+            measurements = result_entry.get('measurements', {}).get(channel)
             if measurements is not None:
                 result[method_name] = measurements
         
-        return result
+        return self._channel_measurements.setdefault(channel, result)
     
     # ========================================================================
     # Utility Methods
     # ========================================================================
     
-    def get_available_channels_for_method(self, method_name: str) -> Set[str]:
+    def get_available_channels_for_method(self, method_name: str) -> FrozenSet[str]:
         """
         Get which channels have data for a specific method.
         
@@ -346,15 +406,10 @@ class SatResults:
             method_name: Name of analysis method
             
         Returns:
-            Set of channel names that have measurements
+            Frozen set of channel names that have measurements
+            (precomputed when the results are indexed)
         """
-        result_entry = self._method_index.get(method_name)
-        
-        if result_entry is None:
-            return set()
-        
-        measurements = result_entry.get('measurements', {})
-        return set(measurements.keys())
+        return self._method_channels.get(method_name, frozenset())
     
     def summary(self) -> Dict[str, Any]:
         """
@@ -388,20 +443,80 @@ class SatResults:
 # Validation helpers
 # ============================================================================
 
+def _resolve_results_path(path: Path) -> Path:
+    """
+    Map a directory to the results.json inside it; other paths are returned as is.
+    
+    Raises:
+        SatLoadError: If the directory does not contain results.json
+    """
+    if path.is_dir():
+        candidate = path / 'results.json'
+        if not candidate.exists():
+            raise SatLoadError(
+                f"Directory does not contain results.json: {path}"
+            )
+        return candidate
+    return path
+
+
+def _parse_json(raw: bytes) -> Any:
+    """
+    Parse UTF-8 JSON bytes; orjson when installed, the standard library otherwise.
+    
+    Documents orjson rejects (e.g. NaN / Infinity literals, which Python's
+    json module writes and accepts) are parsed again by the standard library,
+    so the accepted input and the result are the same either way.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw.decode('utf-8'))
+
+
 def validate_sat_results(path: Path | str) -> tuple[bool, Optional[str]]:
     """
     Validate a SAT results.json file without fully loading it.
     
+    Results are memoized per (path, mtime, ctime, size) of the results.json
+    the loader would read: validating an unchanged file again does not
+    re-read it. Any change to the file, including its permissions (ctime),
+    invalidates the entry.
+    
     Args:
-        path: Path to results.json
+        path: Path to results.json or directory containing it
         
     Returns:
         (is_valid, error_message) tuple
     """
+    path = Path(path)
+    try:
+        results_path = _resolve_results_path(path)
+        st = results_path.stat()
+    except (SatLoadError, OSError):
+        # Let the loader produce the error message
+        return _validate_uncached(path)
+    return _validate_cached(
+        str(path), str(results_path.resolve()), st.st_mtime_ns, st.st_ctime_ns, st.st_size
+    )
+
+
+@lru_cache(maxsize=128)
+def _validate_cached(
+    path_str: str, resolved: str, mtime_ns: int, ctime_ns: int, size: int
+) -> tuple[bool, Optional[str]]:
+    # resolved/mtime_ns/ctime_ns/size are part of the cache key only; messages keep
+    # the path as given by the caller.
+    return _validate_uncached(Path(path_str))
+
+
+def _validate_uncached(path: Path) -> tuple[bool, Optional[str]]:
     try:
         SatResults.load(path)
         return (True, None)
     except SatLoadError as e:
         return (False, str(e))
     except Exception as e:
-        return (False, f"Unexpected error: {e}")
\ No newline at end of file
+        return (False, f"Unexpected error: {e}")
@@ -6,7 +6,27 @@ Defines the output contract for applicability evaluation.
 
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import Dict, List
+from enum import Enum
+from typing import Dict, List, Tuple
+
+
+class ApplicabilityStatus(str, Enum):
+    """
+    Outcome of applicability evaluation.
+
+    A str Enum, so members still compare equal to the plain status strings
+    (report.status == 'applicable'). Rendered (str, format, JSON) as the value.
+    """
+    APPLICABLE = "applicable"
+    UNDERCONSTRAINED = "underconstrained"
+    MISSING_INPUTS = "missing_inputs"
+    NOT_APPLICABLE = "not_applicable"       # reserved: structural incompatibility
+
+    def __str__(self) -> str:
+        return self.value
+
+    def __format__(self, format_spec: str) -> str:
+        return format(str(self), format_spec)
 
 
 @dataclass(frozen=True)
@@ -21,25 +41,25 @@ class ApplicabilityReport:
         method_id: Unique method identifier
         family: Method family (e.g. 'time_domain', 'frequency_domain')
         label: Human-readable method name
-        status: One of:
-            - 'applicable': all required inputs present and stable
-            - 'missing_inputs': at least one required input unavailable
-            - 'underconstrained': required inputs exist but unstable
-            - 'not_applicable': structural incompatibility (reserved)
+        status: ApplicabilityStatus, one of:
+            - APPLICABLE: all required inputs present and stable
+            - MISSING_INPUTS: at least one required input unavailable
+            - UNDERCONSTRAINED: required inputs exist but unstable
+            - NOT_APPLICABLE: structural incompatibility (reserved)
         required_inputs: List of input families required by this method
         missing_inputs: Dict mapping family → reason for each missing input
         unstable_inputs: Dict mapping family → reason for each unstable input
-        diagnostics: Additional factual observations
+        diagnostics: Additional factual observations (immutable; empty tuple if none)
         provenance: How this evaluation was performed
     """
     method_id: str
     family: str
     label: str
-    status: str
+    status: ApplicabilityStatus
     required_inputs: List[str]
     missing_inputs: Dict[str, str] = field(default_factory=dict)
     unstable_inputs: Dict[str, str] = field(default_factory=dict)
-    diagnostics: List[str] = field(default_factory=list)
+    diagnostics: Tuple[str, ...] = ()
     provenance: Dict[str, str] = field(default_factory=dict)
     
     def summary(self) -> str:
@@ -48,4 +68,4 @@ class ApplicabilityReport:
     
     def is_applicable(self) -> bool:
         """Check if method can be attempted"""
-        return self.status == 'applicable'
\ No newline at end of file
+        return self.status == ApplicabilityStatus.APPLICABLE
\ No newline at end of file
@@ -7,10 +7,36 @@ ETHICAL PRINCIPLE: No hidden heuristics. All observations are factual.
 """
 
 from __future__ import annotations
+import sys
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Mapping, Optional
 
+import numpy as np
+
+
+# Input family tags, interned once so every Input.family is the same object
+FAMILY_E = sys.intern('E')
+FAMILY_DELTA = sys.intern('Δ')
+FAMILY_S = sys.intern('S')
+FAMILY_V = sys.intern('V')
+FAMILY_M = sys.intern('M')
+FAMILY_R = sys.intern('R')
+
+# Canonical family order
+FAMILIES = (FAMILY_E, FAMILY_DELTA, FAMILY_S, FAMILY_V, FAMILY_M, FAMILY_R)
+
+# Fixed position of the metrics read by applicability checks in Input.metrics_vec
+METRIC_SLOTS = {
+    'regularity_score': 0,
+    'coefficient_of_variation': 1,
+    'ratio_short': 2,
+    'ratio_long': 3,
+    'num_sources': 4,
+    'is_proxy_only': 5,
+    'num_relation_types': 6,
+}
+
 
 @dataclass(frozen=True)
 class Provenance:
@@ -34,17 +60,31 @@ class Provenance:
         cls,
         sat_methods: List[str],
         sat_params: Dict[str, Dict[str, Any]],
-        builder_version: str
+        builder_version: str,
+        timestamp: Optional[str] = None
     ) -> Provenance:
-        """Create Provenance with automatic timestamp"""
+        """
+        Create Provenance with automatic timestamp.
+
+        The timestamp is the current UTC time of this call (ISO format, 'Z'
+        suffix). Every Input of a run thus records when it was built.
+
+        timestamp: Test-only hook, to get deterministic provenance in tests.
+                   The pipeline and grammar builders never pass it.
+        """
         return cls(
             sat_methods=sat_methods,
             sat_params=sat_params,
             builder_version=builder_version,
-            timestamp=datetime.utcnow().isoformat() + 'Z'
+            timestamp=timestamp if timestamp is not None else _utc_timestamp()
         )
 
 
+def _utc_timestamp() -> str:
+    """Current UTC time as an ISO string with a 'Z' suffix (naive UTC isoformat)"""
+    return datetime.now(timezone.utc).replace(tzinfo=None).isoformat() + 'Z'
+
+
 @dataclass(frozen=True)
 class Input:
     """
@@ -68,12 +108,59 @@ class Input:
     notes: List[str] = field(default_factory=list)
 
     def __post_init__(self):
-        """Validate family"""
-        valid_families = ['E', 'Δ', 'S', 'V', 'M', 'R']
-        if self.family not in valid_families:
+        """Validate family, intern it and build metrics_vec"""
+        if self.family not in FAMILIES:
             raise ValueError(
-                f"Invalid family '{self.family}'. Must be one of {valid_families}"
+                f"Invalid family '{self.family}'. Must be one of {list(FAMILIES)}"
             )
+        object.__setattr__(self, 'family', sys.intern(self.family))
+        object.__setattr__(self, '_metrics_vec', _metrics_vector(self.metrics))
+
+    @property
+    def metrics_vec(self) -> np.ndarray:
+        """
+        Read-only float64 array of the METRIC_SLOTS metrics, built at construction.
+
+        Absent metrics read as 0.0 (the default applied by the checks).
+        `metrics` stays the authoritative, exported mapping.
+        """
+        return self._metrics_vec
+
+    @classmethod
+    def _unchecked(
+        cls,
+        family: str,
+        available: bool,
+        data: Optional[Any],
+        provenance: Provenance,
+        metrics: Dict[str, float],
+        notes: Optional[List[str]] = None
+    ) -> Input:
+        """
+        Construct without __post_init__ validation.
+
+        For SAP² grammar builders only, which always pass one of the
+        FAMILY_* constants. External callers use the validating constructor.
+        """
+        self = object.__new__(cls)
+        object.__setattr__(self, 'family', family)
+        object.__setattr__(self, 'available', available)
+        object.__setattr__(self, 'data', data)
+        object.__setattr__(self, 'provenance', provenance)
+        object.__setattr__(self, 'metrics', metrics)
+        object.__setattr__(self, 'notes', notes if notes is not None else [])
+        object.__setattr__(self, '_metrics_vec', _metrics_vector(metrics))
+        return self
+
+
+def _metrics_vector(metrics: Mapping[str, float]) -> np.ndarray:
+    """Read-only float64 array of the METRIC_SLOTS metrics (absent metrics: 0.0)"""
+    vec = np.zeros(len(METRIC_SLOTS), dtype=np.float64)
+    for name, slot in METRIC_SLOTS.items():
+        if name in metrics:
+            vec[slot] = metrics[name]
+    vec.setflags(write=False)
+    return vec
 
 
 @dataclass(frozen=True)
@@ -90,7 +177,7 @@ class InputBundle:
 
     def __post_init__(self):
         """Validate that all 6 families are present"""
-        expected = {'E', 'Δ', 'S', 'V', 'M', 'R'}
+        expected = set(FAMILIES)
         actual = set(self.inputs.keys())
 
         if actual != expected:
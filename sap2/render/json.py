@@ -8,38 +8,57 @@ Presentation-only:
 - No decoding logic
 - No heuristics
 
-Provides robust serialization for dataclasses, enums, and common containers.
+Provides robust serialization for dataclasses, enums, NumPy arrays, and common containers.
 """
 
 from __future__ import annotations
 
 import json
-from dataclasses import asdict, is_dataclass
+from dataclasses import fields, is_dataclass
 from enum import Enum
 from pathlib import Path
 from typing import Any, Mapping, Sequence
 
+import numpy as np
+
 
 def to_jsonable(obj: Any) -> Any:
     """
     Convert SAP² objects into JSON-serializable structures.
     Conservative: transforms representation only.
     """
+    # Exact-type dispatch for the common node types (primitives, plain
+    # containers, arrays). Subclasses (enums, NumPy scalars, ...) fall
+    # through to the ordered checks below.
+    handler = _HANDLERS.get(type(obj))
+    if handler is not None:
+        return handler(obj)
+
     if obj is None:
         return None
 
+    # str/int-mixin enums (ApplicabilityStatus, ExperimentStatus) are exported
+    # by value. Checked before str, which they subclass.
+    if isinstance(obj, Enum):
+        return obj.value
+
     if isinstance(obj, (str, int, float, bool)):
         return obj
 
+    # NumPy payloads (e.g. Δ intervals) are converted here, at the JSON boundary
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+
+    if isinstance(obj, np.generic):
+        return obj.item()
+
     if isinstance(obj, Path):
         return str(obj)
 
-    if isinstance(obj, Enum):
-        return obj.value
-
-    if is_dataclass(obj):
-        # asdict converts nested dataclasses to dict/list, but may keep Enums; post-process recursively.
-        return to_jsonable(asdict(obj))
+    if is_dataclass(obj) and not isinstance(obj, type):
+        # Field by field, without the deep copy dataclasses.asdict would make
+        # of every payload (artifacts, parameters) before converting it.
+        return {f.name: to_jsonable(getattr(obj, f.name)) for f in fields(obj)}
 
     if isinstance(obj, Mapping):
         return {str(k): to_jsonable(v) for k, v in obj.items()}
@@ -54,17 +73,57 @@ def to_jsonable(obj: Any) -> Any:
     return str(obj)
 
 
+def _identity(obj: Any) -> Any:
+    return obj
+
+
+def _mapping_to_jsonable(obj: Mapping) -> dict:
+    return {str(k): to_jsonable(v) for k, v in obj.items()}
+
+
+def _sequence_to_jsonable(obj: Sequence) -> list:
+    # Flat lists of plain scalars (bitstreams, symbol streams, positions) are
+    # copied after one C-level type scan instead of element-wise conversion.
+    if _PLAIN_SCALARS.issuperset(map(type, obj)):
+        return list(obj)
+    return [to_jsonable(v) for v in obj]
+
+
+# Exact types that to_jsonable returns unchanged
+_PLAIN_SCALARS = frozenset({type(None), str, int, float, bool})
+
+
+_HANDLERS = {
+    type(None): _identity,
+    str: _identity,
+    int: _identity,
+    float: _identity,
+    bool: _identity,
+    dict: _mapping_to_jsonable,
+    list: _sequence_to_jsonable,
+    tuple: _sequence_to_jsonable,
+    np.ndarray: np.ndarray.tolist,
+}
+
+
 def write_json(path: str | Path, payload: Any, *, indent: int = 2) -> Path:
     """
     Write payload to path as JSON.
     Returns the resolved output path.
     """
     out = Path(path)
-    out.parent.mkdir(parents=True, exist_ok=True)
 
     data = to_jsonable(payload)
 
-    with out.open("w", encoding="utf-8") as f:
+    # The parent directory usually exists already (bundles share one output
+    # directory); it is only created when opening the file fails.
+    try:
+        f = out.open("w", encoding="utf-8")
+    except FileNotFoundError:
+        out.parent.mkdir(parents=True, exist_ok=True)
+        f = out.open("w", encoding="utf-8")
+
+    with f:
         json.dump(data, f, ensure_ascii=False, indent=indent, sort_keys=True)
 
     return out.resolve()
@@ -76,3 +135,4 @@ def write_json_bundle(output_dir: str | Path, name: str, payload: Any, *, indent
     """
     output_dir = Path(output_dir)
     return write_json(output_dir / f"{name}.json", payload, indent=indent)
+
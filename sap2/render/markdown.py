@@ -13,6 +13,8 @@ Consumes already-computed artifacts and prints a human-readable report.
 
 from __future__ import annotations
 
+import io
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Mapping
 
@@ -42,78 +44,97 @@ def render_pipeline_run(
       - applicability: Dict[method_id, ApplicabilityReport-like]
       - experiments: Dict[method_id, ExperimentResult-like]
     """
-    lines: list[str] = []
-    lines.append(f"# {title}")
-    lines.append("")
+    # Lines are written to one buffer, each followed by "\n"; the final
+    # newline is dropped on return ("\n".join semantics).
+    buf = io.StringIO()
+    write = buf.write
+    write(f"# {title}\n")
+    write("\n")
 
     sat_source = getattr(run, "sat_source", None)
     matrix_ver = getattr(run, "matrix_schema_version", None)
 
     if sat_source is not None:
-        lines.append(f"- SAT source: `{sat_source}`")
+        write(f"- SAT source: `{sat_source}`\n")
     if matrix_ver is not None:
-        lines.append(f"- Matrix schema_version: `{matrix_ver}`")
+        write(f"- Matrix schema_version: `{matrix_ver}`\n")
     if sat_source is not None or matrix_ver is not None:
-        lines.append("")
+        write("\n")
 
     channels = getattr(run, "channels", {}) or {}
     if not channels:
-        lines.append("_No channels produced._")
-        lines.append("")
-        return "\n".join(lines)
+        write("_No channels produced._\n")
+        write("\n")
+        return buf.getvalue()[:-1]
 
     for channel_name, ch in channels.items():
-        lines.append(f"## Channel: {channel_name}")
-        lines.append("")
+        write(f"## Channel: {channel_name}\n")
+        write("\n")
 
         reports = getattr(ch, "applicability", {}) or {}
         experiments = getattr(ch, "experiments", {}) or {}
 
         if reports:
-            lines.append("### Applicability")
-            lines.append("")
-            lines.append("| method_id | status | missing_required | unstable_required |")
-            lines.append("|---|---:|---:|---:|")
-
-            for method_id in sorted(reports.keys()):
-                rep = reports[method_id]
-                status = _get(rep, "status", "?")
-                # Use correct field names from ApplicabilityReport
-                missing = _len(_get(rep, "missing_inputs", {}))
-                unstable = _len(_get(rep, "unstable_inputs", {}))
-                lines.append(f"| `{method_id}` | `{status}` | {missing} | {unstable} |")
-
-            lines.append("")
+            write("### Applicability\n")
+            write("\n")
+            write("| method_id | status | missing_required | unstable_required |\n")
+            write("|---|---:|---:|---:|\n")
+
+            for method_id in _sorted_methods(frozenset(reports.keys())):
+                write(_applicability_row(method_id, reports[method_id]))
+
+            write("\n")
         else:
-            lines.append("_No applicability reports._")
-            lines.append("")
+            write("_No applicability reports._\n")
+            write("\n")
 
         if experiments:
-            lines.append("### Experiments")
-            lines.append("")
-            lines.append("| method_id | status | diagnostics |")
-            lines.append("|---|---:|---|")
+            write("### Experiments\n")
+            write("\n")
+            write("| method_id | status | diagnostics |\n")
+            write("|---|---:|---|\n")
 
-            for method_id in sorted(experiments.keys()):
-                exp = experiments[method_id]
-                status = _get(exp, "status", "?")
-                diags = _get(exp, "diagnostics", [])
-                diag_str = "; ".join(str(d) for d in diags) if diags else ""
-                lines.append(f"| `{method_id}` | `{status}` | {diag_str} |")
+            for method_id in _sorted_methods(frozenset(experiments.keys())):
+                write(_experiment_row(method_id, experiments[method_id]))
 
-            lines.append("")
+            write("\n")
 
             # Hypotheses summary (cross-decoder)
             hyp_lines = _render_hypotheses_summary(experiments)
             if hyp_lines:
-                lines.append("### Hypotheses Summary")
-                lines.append("")
-                lines.extend(hyp_lines)
+                write("### Hypotheses Summary\n")
+                write("\n")
+                write("\n".join(hyp_lines) + "\n")
         else:
-            lines.append("_No experiments executed._")
-            lines.append("")
+            write("_No experiments executed._\n")
+            write("\n")
+
+    return buf.getvalue()[:-1]
+
 
-    return "\n".join(lines)
+def _applicability_row(method_id: str, rep: Any) -> str:
+    # One dict/attribute dispatch per row instead of one per field.
+    # Field names follow ApplicabilityReport.
+    if isinstance(rep, dict):
+        status = rep.get("status", "?")
+        missing = rep.get("missing_inputs", {})
+        unstable = rep.get("unstable_inputs", {})
+    else:
+        status = getattr(rep, "status", "?")
+        missing = getattr(rep, "missing_inputs", {})
+        unstable = getattr(rep, "unstable_inputs", {})
+    return f"| `{method_id}` | `{status}` | {_len(missing)} | {_len(unstable)} |\n"
+
+
+def _experiment_row(method_id: str, exp: Any) -> str:
+    if isinstance(exp, dict):
+        status = exp.get("status", "?")
+        diags = exp.get("diagnostics", [])
+    else:
+        status = getattr(exp, "status", "?")
+        diags = getattr(exp, "diagnostics", [])
+    diag_str = "; ".join(str(d) for d in diags) if diags else ""
+    return f"| `{method_id}` | `{status}` | {diag_str} |\n"
 
 
 def _render_hypotheses_summary(experiments: Mapping[str, Any]) -> list[str]:
@@ -127,7 +148,7 @@ def _render_hypotheses_summary(experiments: Mapping[str, Any]) -> list[str]:
     """
     lines: list[str] = []
 
-    for method_id in sorted(experiments.keys()):
+    for method_id in _sorted_methods(frozenset(experiments.keys())):
         exp = experiments[method_id]
         artifacts = _get(exp, "artifacts", {}) or {}
         hypotheses = artifacts.get("hypotheses")
@@ -173,6 +194,17 @@ def _render_hypotheses_summary(experiments: Mapping[str, Any]) -> list[str]:
     return lines
 
 
+@lru_cache(maxsize=64)
+def _sorted_methods(keys: frozenset) -> tuple:
+    """
+    Sorted method ids for a set of keys.
+
+    Channels of one run usually share the same method set, so the sort is
+    done once per distinct set.
+    """
+    return tuple(sorted(keys))
+
+
 def _get(obj: Any, key: str, default: Any) -> Any:
     if isinstance(obj, dict):
         return obj.get(key, default)
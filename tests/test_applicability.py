@@ -0,0 +1,138 @@
+"""
+Regression tests for applicability matrix loading and evaluation.
+"""
+
+import itertools
+import os
+import random
+import shutil
+from pathlib import Path
+
+import pytest
+
+from sap2.applicability.checks import (
+    evaluate_all_methods,
+    evaluate_applicability,
+    filter_applicable,
+)
+from sap2.applicability.matrix_loader import load_applicability_matrix
+from sap2.applicability.matrix_mirror import write_json_mirrors
+from sap2.applicability.params import ApplicabilityParams
+from sap2.model.applicability import ApplicabilityStatus
+from sap2.model.inputs import FAMILIES, Input, InputBundle, Provenance
+
+
+MATRICES_DIR = Path(__file__).resolve().parents[1] / "sap2" / "applicability" / "matrices"
+
+LABEL = 'label: "Duration-based (Morse-like)"'
+
+
+@pytest.fixture
+def matrices_dir(tmp_path):
+    target = tmp_path / "matrices"
+    shutil.copytree(MATRICES_DIR, target, ignore=shutil.ignore_patterns("*.json"))
+    shutil.copy(MATRICES_DIR / "matrix.schema.json", target)
+    return target
+
+
+def _relabel(path, label, *, mtime_ns):
+    path.write_text(path.read_text(encoding="utf-8").replace("Duration-based (Morse-like)", label), encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def _morse_label(matrices_dir):
+    return load_applicability_matrix(matrices_dir).methods["duration_based_morse_like"].label
+
+
+# ============================================================================
+# JSON mirrors
+# ============================================================================
+
+def test_fresh_mirror_is_read_instead_of_yaml(matrices_dir):
+    yaml_path = matrices_dir / "time_domain.yaml"
+    mtime_ns = yaml_path.stat().st_mtime_ns
+    write_json_mirrors(matrices_dir)
+
+    _relabel(matrices_dir / "time_domain.json", "from mirror", mtime_ns=mtime_ns + 1_000_000_000)
+
+    assert _morse_label(matrices_dir) == "from mirror"
+
+
+def test_stale_mirror_is_ignored(matrices_dir):
+    yaml_path = matrices_dir / "time_domain.yaml"
+    assert LABEL in yaml_path.read_text(encoding="utf-8")
+    write_json_mirrors(matrices_dir)
+    mirror_mtime_ns = (matrices_dir / "time_domain.json").stat().st_mtime_ns
+    assert _morse_label(matrices_dir) == "Duration-based (Morse-like)"
+
+    # YAML edited after the mirror was generated: the mirror must not hide it
+    _relabel(yaml_path, "edited yaml", mtime_ns=mirror_mtime_ns + 1_000_000_000)
+
+    assert _morse_label(matrices_dir) == "edited yaml"
+
+
+# ============================================================================
+# Batch vs per-method evaluation
+# ============================================================================
+
+def _random_bundle(rng, channel):
+    provenance = Provenance.create([], {}, "test", timestamp="2026-01-01T00:00:00Z")
+    metrics = {
+        "E": {"regularity_score": rng.random()},
+        "Δ": {"coefficient_of_variation": rng.random() * 2},
+        "S": {"ratio_short": rng.random(), "ratio_long": rng.random()},
+        "V": {"num_sources": rng.randint(0, 6)},
+        "M": {"is_proxy_only": rng.choice([0.0, 1.0])},
+        "R": {"num_relation_types": rng.randint(0, 4)},
+    }
+    inputs = {
+        family: Input(
+            family=family,
+            available=rng.random() < 0.8,
+            data=None,
+            provenance=provenance,
+            metrics=metrics[family],
+            notes=rng.choice([[], ["no data in SAT results"]]),
+        )
+        for family in FAMILIES
+    }
+    return InputBundle(inputs=inputs, channel=channel)
+
+
+PARAMS = [
+    ApplicabilityParams(),
+    ApplicabilityParams(accept_matrix_proxies=True),
+    ApplicabilityParams(min_regularity=0.5, max_cv=0.5, min_symbol_balance=0.4,
+                        min_vector_sources=4, min_relation_types=2),
+]
+
+
+@pytest.mark.parametrize("params,fast", list(itertools.product(PARAMS, [False, True])))
+def test_evaluate_all_methods_matches_per_method_path(params, fast):
+    matrix = load_applicability_matrix(MATRICES_DIR)
+    rng = random.Random(0)
+
+    for n in range(30):
+        bundle = _random_bundle(rng, channel=rng.choice(["left", "right", "difference"]))
+        reports = evaluate_all_methods(matrix, bundle, params, fast=fast)
+
+        assert list(reports) == list(matrix.methods)
+        for method_id, method in matrix.methods.items():
+            assert reports[method_id] == evaluate_applicability(method, bundle, params, fast=fast)
+
+        applicable = filter_applicable(reports)
+        assert list(applicable) == [
+            method_id for method_id, report in reports.items()
+            if report.status == ApplicabilityStatus.APPLICABLE
+        ]
+        assert all(report.is_applicable() for report in applicable.values())
+
+
+def test_evaluate_all_methods_subset():
+    matrix = load_applicability_matrix(MATRICES_DIR)
+    bundle = _random_bundle(random.Random(1), channel="left")
+    subset = {"duration_based_morse_like", "amplitude_modulation_am"}
+
+    reports = evaluate_all_methods(matrix, bundle, ApplicabilityParams(), method_ids=subset)
+
+    assert set(reports) == subset
@@ -0,0 +1,48 @@
+"""
+Regression tests for ApplicabilityStatus rendering and comparisons.
+"""
+
+import json
+
+from sap2.applicability.checks import filter_applicable
+from sap2.model.applicability import ApplicabilityReport, ApplicabilityStatus
+from sap2.render.json import to_jsonable
+
+
+def _report(status: ApplicabilityStatus) -> ApplicabilityReport:
+    return ApplicabilityReport(
+        method_id="m",
+        family="time_domain",
+        label="M",
+        status=status,
+        required_inputs=["E"],
+    )
+
+
+def test_status_compares_equal_to_plain_strings():
+    assert _report(ApplicabilityStatus.APPLICABLE).status == "applicable"
+    assert _report(ApplicabilityStatus.MISSING_INPUTS).status == "missing_inputs"
+    assert ApplicabilityStatus("underconstrained") is ApplicabilityStatus.UNDERCONSTRAINED
+
+
+def test_status_str_and_format_render_the_value():
+    status = ApplicabilityStatus.UNDERCONSTRAINED
+    assert str(status) == "underconstrained"
+    assert f"{status}" == "underconstrained"
+    assert f"{status:>18}" == "  underconstrained"
+    assert _report(ApplicabilityStatus.APPLICABLE).summary() == "m: applicable"
+
+
+def test_status_is_exported_by_value():
+    exported = to_jsonable(_report(ApplicabilityStatus.MISSING_INPUTS))
+    assert exported["status"] == "missing_inputs"
+    assert type(exported["status"]) is str
+    assert json.loads(json.dumps(exported))["status"] == "missing_inputs"
+
+
+def test_plain_string_status_is_applicable():
+    report = _report("applicable")
+    assert report.is_applicable()
+    assert filter_applicable({"m": report}) == {"m": report}
+    assert filter_applicable({"m": report}, out={}) == {"m": report}
+    assert filter_applicable({"m": _report("missing_inputs")}) == {}
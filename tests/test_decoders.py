@@ -0,0 +1,215 @@
+"""
+Regression tests for the time-domain decoders.
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from sap2.decoders.base import DecoderParams
+from sap2.decoders.time_domain.amplitude_modulation_am import (
+    AmplitudeModulationAmDecoder,
+    _ascii_text,
+    _frame_values,
+)
+from sap2.decoders.time_domain.duration_based_morse_like import DurationBasedMorseLikeDecoder
+from sap2.model.experiment import ExperimentStatus
+from sap2.model.inputs import FAMILIES, Input, InputBundle, Provenance
+
+
+def _bundle(**data):
+    """InputBundle where the families given as keyword arguments carry that data."""
+    provenance = Provenance.create([], {}, "test", timestamp="2026-01-01T00:00:00Z")
+    inputs = {
+        family: Input(
+            family=family,
+            available=family in data,
+            data=data.get(family),
+            provenance=provenance,
+            metrics={},
+        )
+        for family in FAMILIES
+    }
+    return InputBundle(inputs=inputs, channel="left")
+
+
+# ============================================================================
+# Duration-based Morse-like
+# ============================================================================
+
+def test_morse_separators_and_bitstream():
+    bundle = _bundle(**{"Δ": {"intervals": [0.05, 0.3, 0.15, 0.5, 1.0, "x"]}})
+    params = DecoderParams({"letter_gap_min": 0.4, "word_gap_min": 0.8})
+
+    result = DurationBasedMorseLikeDecoder().decode(bundle, params)
+
+    assert result.status is ExperimentStatus.SUCCESS
+    assert result.artifacts["raw"]["symbol_stream"] == [".", "-", "?", "|", "/", "?"]
+    assert result.artifacts["raw"]["bitstream"] == [0, 1, None, None, None, None]
+    assert result.parameters_used["letter_gap_min"] == 0.4
+    assert "symbol counts: dot=1, dash=1, ambiguous=2, letter_sep=1, word_sep=1" in result.diagnostics
+
+
+def test_morse_without_separators():
+    bundle = _bundle(**{"Δ": {"intervals": np.array([0.05, 0.3, 2.0])}})
+
+    result = DurationBasedMorseLikeDecoder().decode(bundle, DecoderParams())
+
+    assert result.artifacts["hypotheses"][0]["representation"] == ".--"
+    assert result.artifacts["raw"]["bitstream"] == [0, 1, 1]
+
+
+# ============================================================================
+# Amplitude modulation (AM)
+# ============================================================================
+
+def _reference_frame_value(frame, msb_first):
+    if msb_first:
+        return int("".join(map(str, frame)), 2)
+    return int("".join(map(str, frame[::-1])), 2)
+
+
+def _reference_candidates(bitstreams, frame_bits_list, msb_first_list, max_offsets, max_hypotheses):
+    """Loop version of the AM framing sweep: every framing, stable sort, then slice."""
+    candidates = []
+    for origin, mapping, bits in bitstreams:
+        for frame_bits in frame_bits_list:
+            for msb_first in msb_first_list:
+                for offset in range(min(max_offsets, max(frame_bits, 1))):
+                    usable = bits[offset:]
+                    n_frames = len(usable) // frame_bits
+                    chars = []
+                    for i in range(n_frames):
+                        val = _reference_frame_value(usable[i * frame_bits:(i + 1) * frame_bits], msb_first)
+                        printable = val in (9, 10, 13) or 32 <= val <= 126
+                        chars.append(chr(val) if printable else "�")
+                    ratio = sum(c != "�" for c in chars) / n_frames if n_frames else 0.0
+                    candidates.append(
+                        {
+                            "source_bitstream": {"origin": origin, "mapping": mapping},
+                            "framing": {"frame_bits": frame_bits, "msb_first": msb_first, "offset": offset},
+                            "printable_ratio": ratio,
+                            "text_candidate": "".join(chars),
+                        }
+                    )
+    candidates.sort(key=lambda c: (c["printable_ratio"], len(c["text_candidate"])), reverse=True)
+    return candidates[:max_hypotheses]
+
+
+def _symbols_for(text):
+    bits = "".join(f"{ord(c):08b}" for c in text)
+    return ["long" if b == "1" else "short" for b in bits]
+
+
+@pytest.mark.parametrize("frame_bits", [3, 7, 8, 12, 70])
+def test_frame_values_bit_order(frame_bits):
+    rng = np.random.default_rng(frame_bits)
+    bits = rng.integers(0, 2, size=5 * frame_bits + 3).astype(np.uint8)
+
+    for offset in range(frame_bits):
+        msb_values, lsb_values = _frame_values(bits, frame_bits, offset)
+        n_frames = (len(bits) - offset) // frame_bits
+        frames = [bits[offset + i * frame_bits: offset + (i + 1) * frame_bits].tolist() for i in range(n_frames)]
+        # Wide frames report any value above a byte as 256 (non-printable)
+        assert msb_values.tolist() == [min(_reference_frame_value(f, True), 256) for f in frames]
+        assert lsb_values.tolist() == [min(_reference_frame_value(f, False), 256) for f in frames]
+
+
+def test_wide_frame_with_high_bit_is_not_printable():
+    # 64-bit frame: top bit set, low byte 0x41 ('A')
+    bits = np.array([1] + [0] * 55 + [0, 1, 0, 0, 0, 0, 0, 1], dtype=np.uint8)
+
+    msb_values, _ = _frame_values(bits, 64, 0)
+
+    assert _ascii_text(msb_values) == "\ufffd"
+    assert _ascii_text(_frame_values(bits[1:].copy(), 63, 0)[0]) == "A"
+
+
+def test_frame_values_rejects_impossible_framings():
+    bits = np.ones(10, dtype=np.uint8)
+    assert _frame_values(bits, 0, 0) is None
+    assert _frame_values(bits, 8, 8) is None
+    assert _frame_values(bits, 12, 0) is None
+
+
+def test_am_recovers_msb_first_text_from_symbols():
+    bundle = _bundle(**{
+        "Δ": {"intervals": [0.1] * 16},
+        "S": {"symbols": _symbols_for("Hi")},
+    })
+
+    result = AmplitudeModulationAmDecoder().decode(bundle, DecoderParams())
+
+    best = result.artifacts["raw"]["ascii_hypotheses"][0]
+    assert best["text_candidate"] == "Hi"
+    assert best["printable_ratio"] == 1.0
+    assert best["framing"] == {"frame_bits": 8, "msb_first": True, "offset": 0}
+    assert best["source_bitstream"]["mapping"] == "short=0,long=1"
+
+
+@pytest.mark.parametrize("max_hypotheses", [10, 1, 0, -3, 1000])
+def test_am_top_k_matches_full_ranking(max_hypotheses):
+    rng = random.Random(max_hypotheses)
+    for _ in range(20):
+        n = rng.randint(8, 140)
+        frame_bits_list = rng.sample([3, 5, 7, 8, 9, 12, 64], k=rng.randint(1, 3))
+        msb_first_list = rng.choice([[True, False], [False, True], [True]])
+        max_offsets = rng.randint(1, 10)
+        params = DecoderParams({
+            "frame_bits_list": frame_bits_list,
+            "msb_first_list": msb_first_list,
+            "max_offsets": max_offsets,
+            "max_hypotheses": max_hypotheses,
+        })
+
+        if rng.random() < 0.5:
+            symbols = [rng.choice(["short", "long"]) for _ in range(n)]
+            bundle = _bundle(**{"Δ": {"intervals": [0.1] * n}, "S": {"symbols": symbols}})
+            bits_a = [0 if s == "short" else 1 for s in symbols]
+            bitstreams = [
+                ("S.symbols", "short=0,long=1", bits_a),
+                ("S.symbols", "short=1,long=0", [1 - b for b in bits_a]),
+            ]
+        else:
+            intervals = [rng.choice([0.1, 0.2, 0.3, 0.4]) for _ in range(n)]
+            bundle = _bundle(**{"Δ": {"intervals": intervals}})
+            median = sorted(intervals)[n // 2]
+            bits_a = [0 if x < median else 1 for x in intervals]
+            bitstreams = [
+                ("Δ.intervals", f"<median=0,>=median=1 (median={median:.6f})", bits_a),
+                ("Δ.intervals", f"<median=1,>=median=0 (median={median:.6f})", [1 - b for b in bits_a]),
+            ]
+
+        result = AmplitudeModulationAmDecoder().decode(bundle, params)
+
+        expected = _reference_candidates(bitstreams, frame_bits_list, msb_first_list, max_offsets, max_hypotheses)
+        assert result.artifacts["raw"]["ascii_hypotheses"] == expected
+
+
+def test_am_negative_max_hypotheses_drops_from_the_end():
+    bundle = _bundle(**{"Δ": {"intervals": [0.1] * 16}, "S": {"symbols": _symbols_for("Hi")}})
+
+    everything = AmplitudeModulationAmDecoder().decode(bundle, DecoderParams({"max_hypotheses": 1000}))
+    trimmed = AmplitudeModulationAmDecoder().decode(bundle, DecoderParams({"max_hypotheses": -3}))
+
+    all_candidates = everything.artifacts["raw"]["ascii_hypotheses"]
+    assert len(all_candidates) == 2 * 2 * (8 + 7)
+    assert trimmed.artifacts["raw"]["ascii_hypotheses"] == all_candidates[:-3]
+
+
+def test_am_median_fallback_maps_nan_intervals_to_one():
+    # "~~" is 01111110 01111110: zeros are short intervals, ones long or NaN.
+    bits = "".join(f"{ord(c):08b}" for c in "~~")
+    intervals = [0.1 if b == "0" else 0.4 for b in bits]
+    intervals[2] = intervals[10] = float("nan")
+    bundle = _bundle(**{"Δ": {"intervals": intervals}})
+
+    result = AmplitudeModulationAmDecoder().decode(bundle, DecoderParams({"max_hypotheses": 1000}))
+
+    (hypothesis,) = [
+        h for h in result.artifacts["raw"]["ascii_hypotheses"]
+        if h["framing"] == {"frame_bits": 8, "msb_first": True, "offset": 0}
+        and h["source_bitstream"]["mapping"].startswith("<median=0,>=median=1")
+    ]
+    assert hypothesis["text_candidate"] == "~~"
@@ -0,0 +1,47 @@
+"""
+Regression tests for the grammar builders.
+"""
+
+import pytest
+
+from sap2.grammar.builders.intervals import build_intervals
+from sap2.grammar.builders.pulses import build_pulse_families
+from sap2.io.load_sat import SatResults
+
+
+def _sat(positions):
+    return SatResults({
+        "metadata": {"channels": ["left"]},
+        "results": {
+            "temporal": [
+                {
+                    "method": "pulse_detection",
+                    "measurements": {"left": {"num_pulses": len(positions), "pulse_positions": positions}},
+                }
+            ]
+        },
+    })
+
+
+def test_intervals_from_numeric_positions():
+    delta = build_intervals(_sat([0, 1000, 2500]), "left")
+
+    assert delta.available
+    assert delta.data["intervals"].tolist() == [1000.0, 1500.0]
+    assert delta.metrics["interval_mean"] == 1250.0
+
+
+@pytest.mark.parametrize("positions,error", [
+    ([0, None, 5000, 9000, 14000], TypeError),
+    ([0, "5000", 9000], TypeError),
+    ([0, float("nan"), 9000], ValueError),
+    ([0, float("inf"), 9000], ValueError),
+])
+def test_malformed_positions_fail_loudly(positions, error):
+    sat = _sat(positions)
+
+    with pytest.raises(error, match="pulse_positions"):
+        build_intervals(sat, "left")
+    with pytest.raises(error, match="pulse_positions"):
+        build_pulse_families(sat, "left")
+
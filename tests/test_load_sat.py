@@ -0,0 +1,54 @@
+"""
+Regression tests for sap2/io/load_sat.py.
+"""
+
+import json
+import os
+
+from sap2.io.load_sat import SatResults, validate_sat_results
+
+
+def _write_results(path, payload):
+    path.write_text(json.dumps(payload), encoding="utf-8")
+
+
+def test_directory_input_loads_results_json(tmp_path):
+    _write_results(tmp_path / "results.json", {"metadata": {}, "results": {}})
+    sat = SatResults.load(tmp_path)
+    assert sat.source_path == tmp_path / "results.json"
+
+
+def test_validate_directory_sees_changes_to_results_json(tmp_path):
+    results = tmp_path / "results.json"
+    _write_results(results, {"metadata": {}, "results": {}})
+    dir_stat = tmp_path.stat()
+    assert validate_sat_results(tmp_path) == (True, None)
+
+    # Rewrite results.json in place: the directory entry itself is unchanged.
+    _write_results(results, {"metadata": {}})
+    os.utime(tmp_path, ns=(dir_stat.st_atime_ns, dir_stat.st_mtime_ns))
+
+    is_valid, message = validate_sat_results(tmp_path)
+    assert not is_valid
+    assert "results" in message
+
+
+def test_validate_directory_without_results_json(tmp_path):
+    is_valid, message = validate_sat_results(tmp_path)
+    assert not is_valid
+    assert "does not contain results.json" in message
+
+
+
+def test_validate_sees_changes_that_keep_mtime_and_size(tmp_path):
+    # Same-size rewrite with the mtime restored: only ctime tells them apart,
+    # as after a chmod that makes an unreadable file readable again.
+    results = tmp_path / "results.json"
+    results.write_text('{"metadata": {}, "resultz": {}}', encoding="utf-8")
+    st = results.stat()
+    assert not validate_sat_results(results)[0]
+
+    results.write_text('{"metadata": {}, "results": {}}', encoding="utf-8")
+    os.utime(results, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+    assert validate_sat_results(results) == (True, None)
@@ -0,0 +1,14 @@
+"""
+Regression tests for sap2/engine/pipeline.py.
+"""
+
+import pytest
+
+from sap2.applicability.params import ApplicabilityParams
+from sap2.engine.pipeline import run_pipeline
+
+
+@pytest.mark.parametrize("jobs", [0, -2])
+def test_run_pipeline_rejects_jobs_below_one(tmp_path, jobs):
+    with pytest.raises(ValueError, match="jobs must be >= 1"):
+        run_pipeline(tmp_path, tmp_path, ApplicabilityParams(), jobs=jobs)